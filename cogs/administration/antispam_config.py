@@ -2,80 +2,24 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from utils.colors import get_embed_color
-from utils.antispam import AntiSpamSystem
 import asyncio
-import json
-import os
 from typing import Dict, List, Optional
 from datetime import datetime, timezone, timedelta
 
 class AntiSpamConfigCommand(commands.Cog):
-    def __init__(self, bot):
+    def __init__(self, bot, antispam):
         self.bot = bot
-        self.antispam = AntiSpamSystem(bot)
-        self.config_file = "data/antispam_config.json"
-        self.config = self.load_config()
+        self.antispam = antispam
         
         self.active_configurations = {}  
 
-    def load_config(self) -> Dict:
-        
-        try:
-            
-            if not os.path.exists("data"):
-                os.makedirs("data")
-            
-            
-            if not os.path.exists(self.config_file):
-                default_config = {}
-                with open(self.config_file, "w", encoding="utf-8") as f:
-                    json.dump(default_config, f, indent=4)
-                return default_config
-            
-            
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                if not content:  
-                    default_config = {}
-                    with open(self.config_file, "w", encoding="utf-8") as f:
-                        json.dump(default_config, f, indent=4)
-                    return default_config
-                return json.loads(content)
-                
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            
-            default_config = {}
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(default_config, f, indent=4)
-            return default_config
-
-    def save_config(self):
-        
-        try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=4)
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde de la configuration: {e}")
-
     def get_guild_config(self, guild_id: int) -> Dict:
         
-        guild_id_str = str(guild_id)
-        if guild_id_str not in self.config:
-            self.config[guild_id_str] = {
-                "enabled": False,
-                "active_channels": [],
-                "max_messages": 5,
-                "time_window": 5  
-            }
-            self.save_config()
-        return self.config[guild_id_str]
+        return self.antispam.get_guild_config(guild_id)
 
     def update_guild_config(self, guild_id: int, config: Dict):
         
-        self.config[str(guild_id)] = config
-        self.save_config()
-        
-        self.antispam.config = self.config
+        self.antispam.update_guild_config(guild_id, config)
 
     def has_permissions(self, interaction: discord.Interaction) -> bool:
         
@@ -426,4 +370,4 @@ class AntiSpamConfigCommand(commands.Cog):
             print(f"Erreur dans la commande antispam: {e}")
 
 async def setup(bot):
-    await bot.add_cog(AntiSpamConfigCommand(bot)) 
+    await bot.add_cog(AntiSpamConfigCommand(bot, bot.anti_spam)) 
@@ -1,7 +1,5 @@
 import discord
 from discord import app_commands
-import json
-import os
 from discord.ext import commands, tasks
 from datetime import datetime, timedelta, timezone
 from utils.colors import get_embed_color
@@ -20,37 +18,24 @@ def admin_or_owner():
 class AutoClearSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.config_file = "data/autoclear_config.json"
-        self.config = self._load_config()
+        self.store = bot.config_store
         self.enabled = True
         self.is_cleaning = False
         self.auto_clear_loop.start()
 
-    def _load_config(self):
-        os.makedirs("data", exist_ok=True)
-        try:
-            with open(self.config_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
-
     def _save_config(self):
-        with open(self.config_file, "w") as f:
-            json.dump(self.config, f, indent=4)
+        self.store.save("autoclear")
 
     def get_guild_config(self, guild_id):
-        guild_id = str(guild_id)
-        if guild_id not in self.config:
-            self.config[guild_id] = {
-                "active_channels": [],
-                "clear_delay": 300
-            }
-        return self.config[guild_id]
+        return self.store.get_guild_config("autoclear", guild_id, lambda: {
+            "active_channels": [],
+            "clear_delay": 300
+        })
 
     @tasks.loop(minutes=1)
     async def auto_clear_loop(self):
         if self.enabled:
-            for guild_id, guild_config in self.config.items():
+            for guild_id, guild_config in list(self.store.all_guild_configs("autoclear").items()):
                 for channel_id in guild_config["active_channels"]:
                     channel = self.bot.get_channel(int(channel_id))
                     if channel:
@@ -181,14 +166,14 @@ class AutoClearSystem(commands.Cog):
 
     async def request_channel_add(self, interaction):
         await interaction.response.send_message(
-            "🔍 Mentionnez le salon à ajouter (ex: 
+            "🔍 Mentionnez le salon à ajouter (ex: #général)",
             ephemeral=True
         )
         self.bot.loop.create_task(self.wait_for_channel(interaction, add=True))
 
     async def request_channel_remove(self, interaction):
         await interaction.response.send_message(
-            "🔍 Mentionnez le salon à retirer (ex: 
+            "🔍 Mentionnez le salon à retirer (ex: #général)",
             ephemeral=True
         )
         self.bot.loop.create_task(self.wait_for_channel(interaction, add=False))
@@ -2,7 +2,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from utils.colors import get_embed_color
-from utils.invites import InvitesSystem
 import asyncio
 from datetime import datetime
 
@@ -18,15 +17,15 @@ def admin_or_owner():
     return app_commands.check(predicate)
 
 class InvitesConfigCommand(commands.Cog):
-    def __init__(self, bot):
+    def __init__(self, bot, invites):
         self.bot = bot
-        self.invites = InvitesSystem(bot)
+        self.invites = invites
 
     @app_commands.command(name="invites", description="Configure le système d'invitations")
     @admin_or_owner()
     async def invites_config(self, interaction: discord.Interaction):
         
-        guild_config = self.bot.invites.get_guild_config(interaction.guild_id)
+        guild_config = self.invites.get_guild_config(interaction.guild_id)
         
         
         toggle_button = discord.ui.Button(
@@ -138,7 +137,7 @@ class InvitesConfigCommand(commands.Cog):
                 if interaction.data["custom_id"] == "toggle_invites":
                     
                     guild_config["enabled"] = not guild_config["enabled"]
-                    self.bot.invites.update_guild_config(interaction.guild_id, guild_config)
+                    self.invites.update_guild_config(interaction.guild_id, guild_config)
                     
                     
                     toggle_button.label = "ON" if not guild_config["enabled"] else "OFF"
@@ -177,7 +176,7 @@ class InvitesConfigCommand(commands.Cog):
                         
                         if channel:
                             guild_config["channels"]["joins"] = channel.id
-                            self.bot.invites.update_guild_config(interaction.guild_id, guild_config)
+                            self.invites.update_guild_config(interaction.guild_id, guild_config)
                             
                             
                             channels_info = []
@@ -221,7 +220,7 @@ class InvitesConfigCommand(commands.Cog):
                         
                         if channel:
                             guild_config["channels"]["leaves"] = channel.id
-                            self.bot.invites.update_guild_config(interaction.guild_id, guild_config)
+                            self.invites.update_guild_config(interaction.guild_id, guild_config)
                             
                             
                             channels_info = []
@@ -239,8 +238,7 @@ class InvitesConfigCommand(commands.Cog):
                         await interaction.followup.send("❌ Temps écoulé", ephemeral=True)
                         
                 elif interaction.data["custom_id"] == "show_leaderboard":
-                    await self.bot.invites.show_leaderboard(interaction.guild, interaction.channel)
-                    await interaction.response.defer()
+                    await self.invites.show_leaderboard(interaction)
                     
         except asyncio.TimeoutError:
             
@@ -248,5 +246,45 @@ class InvitesConfigCommand(commands.Cog):
                 item.disabled = True
             await interaction.message.edit(view=view)
 
+    @app_commands.command(name="invitestats", description="Statistiques des invitations sur les derniers jours")
+    @app_commands.describe(jours="Nombre de jours à analyser (1 à 90)")
+    @admin_or_owner()
+    async def invite_stats(self, interaction: discord.Interaction, jours: app_commands.Range[int, 1, 90] = 7):
+
+        summary = self.invites.history.summarize(interaction.guild_id, jours)
+        codes = sorted(summary["codes"].items(), key=lambda item: item[1], reverse=True)
+        inviters = sorted(
+            summary["inviters"].items(),
+            key=lambda item: item[1]["join"] - item[1]["leave"],
+            reverse=True
+        )
+
+        embed = discord.Embed(
+            title=f"📈 Invitations des {jours} dernier{'s' if jours > 1 else ''} jour{'s' if jours > 1 else ''}",
+            color=get_embed_color("info")
+        )
+
+        embed.add_field(
+            name="🔗 Arrivées par code",
+            value="\n".join(
+                f"`{code}` • {joins} arrivée{'s' if joins > 1 else ''}" for code, joins in codes[:10]
+            ) or "Aucune arrivée enregistrée",
+            inline=False
+        )
+
+        embed.add_field(
+            name="👥 Inviteurs",
+            value="\n".join(
+                f"<@{inviter_id}> • +{counters['join']} / -{counters['leave']}" for inviter_id, counters in inviters[:10]
+            ) or "Aucun inviteur enregistré",
+            inline=False
+        )
+
+        total_joins = sum(counters["join"] for counters in summary["inviters"].values())
+        total_leaves = sum(counters["leave"] for counters in summary["inviters"].values())
+        embed.set_footer(text=f"{total_joins} arrivée{'s' if total_joins > 1 else ''} attribuée{'s' if total_joins > 1 else ''} • {total_leaves} départ{'s' if total_leaves > 1 else ''}")
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 async def setup(bot):
-    await bot.add_cog(InvitesConfigCommand(bot)) 
+    await bot.add_cog(InvitesConfigCommand(bot, bot.invites))
@@ -2,8 +2,35 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from utils.colors import get_embed_color
-from utils.logs import LogsSystem
 from datetime import datetime
+import re
+import time
+
+DURATION_UNITS = {"m": 60, "h": 3600, "d": 86400, "j": 86400, "w": 604800}
+
+SEARCH_LIMIT = 20
+
+def parse_duration(value: str):
+    match = re.fullmatch(r"\s*(\d+)\s*([mhdjw])\s*", value.lower())
+    if not match:
+        return None
+    return int(match.group(1)) * DURATION_UNITS[match.group(2)]
+
+def format_record(record) -> str:
+    payload = record["payload"]
+    when = f"<t:{int(record['ts'])}:f>"
+    if record["kind"] == "message_delete":
+        return f"🗑️ {when} • <#{record['channel_id']}> • {(payload['content'] or 'Aucun contenu')[:80]}"
+    if record["kind"] == "message_edit":
+        return f"✏️ {when} • <#{record['channel_id']}> • {(payload['before'] or '')[:40]} → {(payload['after'] or '')[:40]}"
+    if record["kind"] == "message_bulk_delete":
+        return f"🧹 {when} • <#{record['channel_id']}> • {len(payload['message_ids'])} messages supprimés"
+    title = {
+        "member_ban": "🔨 Banni",
+        "member_unban": "🔓 Débanni",
+        "member_kick": "👢 Expulsé"
+    }[record["kind"]]
+    return f"{title} {when} • <@{record['user_id']}> par <@{payload['moderator_id']}>"
 
 def admin_or_owner():
     async def predicate(interaction: discord.Interaction):
@@ -17,9 +44,9 @@ def admin_or_owner():
     return app_commands.check(predicate)
 
 class LogsConfigCommand(commands.Cog):
-    def __init__(self, bot):
+    def __init__(self, bot, logs):
         self.bot = bot
-        self.logs = LogsSystem(bot)
+        self.logs = logs
 
     @app_commands.command(name="logs", description="Configure le système de logs")
     @admin_or_owner()
@@ -28,6 +55,37 @@ class LogsConfigCommand(commands.Cog):
         embed = await view.create_config_embed()
         await interaction.response.send_message(embed=embed, view=view)
 
+    @app_commands.command(name="logsearch", description="Recherche dans l'archive des logs")
+    @app_commands.describe(
+        user="Membre concerné",
+        since="Période à parcourir (ex: 30m, 12h, 7d)"
+    )
+    @admin_or_owner()
+    async def logsearch(self, interaction: discord.Interaction, user: discord.User, since: str = "7d"):
+        duration = parse_duration(since)
+        if duration is None:
+            await interaction.response.send_message(
+                "❌ Période invalide. Utilisez par exemple `30m`, `12h` ou `7d`.",
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+
+        lines = []
+        async for record in self.logs.archive.search(interaction.guild_id, user.id, time.time() - duration):
+            lines.append(format_record(record))
+            if len(lines) >= SEARCH_LIMIT:
+                break
+
+        embed = discord.Embed(
+            title=f"🔎 Logs de {user}",
+            description="\n".join(lines)[:4096] or "Aucun événement trouvé",
+            color=get_embed_color("logs")
+        )
+        embed.set_footer(text=f"Depuis {since} • {len(lines)} résultat{'s' if len(lines) > 1 else ''} (max {SEARCH_LIMIT})")
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
 class LogsConfigView(discord.ui.View):
     def __init__(self, logs_system, guild_id):
         super().__init__(timeout=120)
@@ -265,4 +323,4 @@ class LogsConfigView(discord.ui.View):
         await interaction.response.send_modal(modal)
 
 async def setup(bot):
-    await bot.add_cog(LogsConfigCommand(bot)) 
+    await bot.add_cog(LogsConfigCommand(bot, bot.logs)) 
@@ -0,0 +1,42 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+import json
+from utils.colors import theme, get_embed_color
+
+def bot_owner_only():
+    async def predicate(interaction: discord.Interaction):
+        if await interaction.client.is_owner(interaction.user):
+            return True
+        await interaction.response.send_message(
+            "❌ Cette commande est réservée au propriétaire du bot.",
+            ephemeral=True
+        )
+        return False
+    return app_commands.check(predicate)
+
+class ThemeCommand(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="reloadtheme", description="Recharge les couleurs des embeds depuis config.json")
+    @bot_owner_only()
+    async def reload_theme(self, interaction: discord.Interaction):
+        try:
+            count = theme.reload()
+        except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
+            await interaction.response.send_message(
+                f"❌ Erreur lors du rechargement des couleurs: {str(e)}",
+                ephemeral=True
+            )
+            return
+
+        embed = discord.Embed(
+            title="🎨 Thème rechargé",
+            description=f"**{count}** couleur{'s' if count > 1 else ''} chargée{'s' if count > 1 else ''} depuis `config.json`.",
+            color=get_embed_color("administration")
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(ThemeCommand(bot))
@@ -3,7 +3,6 @@ from discord import app_commands
 from discord.ext import commands
 from typing import Dict, List
 from utils.colors import get_embed_color
-import json
 
 class HelpView(discord.ui.View):
     def __init__(self, bot, categories, cog_categories):
@@ -14,13 +13,6 @@ class HelpView(discord.ui.View):
         self.current_category = None
         
         
-        try:
-            with open("config.json", "r", encoding="utf-8") as f:
-                self.config = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.config = {"embed_colors": {}}
-        
-        
         for category_name, category_title in categories.items():
             button = discord.ui.Button(
                 label=category_title,
@@ -39,13 +31,10 @@ class HelpView(discord.ui.View):
         await interaction.response.edit_message(embed=embed)
 
     async def create_category_embed(self, category_name: str) -> discord.Embed:
-        
-        color = self.config.get("embed_colors", {}).get(category_name, self.config.get("embed_colors", {}).get("default", 0xFFD700))
-        
         embed = discord.Embed(
             title=f"📚 {self.categories[category_name]}",
             description="Voici les commandes disponibles dans cette catégorie :",
-            color=discord.Color.from_str(color) if isinstance(color, str) else color
+            color=get_embed_color(category_name)
         )
         
         commands_list = []
@@ -102,6 +91,7 @@ class HelpCommand(commands.Cog):
             "AutoClearSystem": "administration",
             "AntiSpamConfigCommand": "administration",
             "AntiLinksConfigCommand": "administration",
+            "ThemeCommand": "administration",
 
             
             "BanCommand": "moderation",
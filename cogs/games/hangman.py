@@ -2,55 +2,21 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import random
-import json
-import os
 from utils.colors import get_embed_color
+from utils.pipeline import STAGE_GAMES
 
 class Hangman(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.scores_file = "data/games/scores.json"
-        self.load_scores()
         self.active_games = {}
-        
-    def load_scores(self):
-        
-        try:
-            with open(self.scores_file, "r", encoding="utf-8") as f:
-                self.scores = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.scores = {}
-            
-    def save_scores(self):
-        
-        os.makedirs(os.path.dirname(self.scores_file), exist_ok=True)
-        with open(self.scores_file, "w", encoding="utf-8") as f:
-            json.dump(self.scores, f, indent=4)
             
-    def get_player_score(self, guild_id, player_id):
-        
-        guild_id = str(guild_id)
-        player_id = str(player_id)
+    async def get_player_score(self, guild_id, player_id):
         
-        if guild_id not in self.scores:
-            self.scores[guild_id] = {}
-        if player_id not in self.scores[guild_id]:
-            self.scores[guild_id][player_id] = 0
-            
-        return self.scores[guild_id][player_id]
+        return await self.bot.storage.get_player_score(guild_id, player_id)
         
-    def add_points(self, guild_id, player_id, points):
+    async def add_points(self, guild_id, player_id, points):
         
-        guild_id = str(guild_id)
-        player_id = str(player_id)
-        
-        if guild_id not in self.scores:
-            self.scores[guild_id] = {}
-        if player_id not in self.scores[guild_id]:
-            self.scores[guild_id][player_id] = 0
-            
-        self.scores[guild_id][player_id] += points
-        self.save_scores()
+        await self.bot.storage.add_points(guild_id, player_id, points)
         
     @app_commands.command(name="hangman", description="Jouer au pendu")
     async def hangman(self, interaction: discord.Interaction):
@@ -122,25 +88,28 @@ class Hangman(commands.Cog):
         
         await interaction.response.send_message(embed=embed)
         
-    @commands.Cog.listener()
-    async def on_message(self, message):
+    async def cog_load(self):
+        self.bot.pipeline.register("games", self.route_message, STAGE_GAMES)
+
+    async def cog_unload(self):
+        self.bot.pipeline.unregister("games")
+
+    async def route_message(self, message):
         
-        if message.author.bot:
-            return
+        game = self.active_games.get(str(message.channel.id))
+        if game is None or message.author.id != game["player"]:
+            return False
             
-        channel_id = str(message.channel.id)
-        if channel_id not in self.active_games:
-            return
-            
-        game = self.active_games[channel_id]
         
-        
-        if message.author.id != game["player"]:
-            return
+        if not message.content.isalpha() or len(message.content) != 1:
+            return False
             
+        await self.play_letter(message, game)
+        return True
+
+    async def play_letter(self, message, game):
         
-        if not message.content.isalpha() or len(message.content) != 1:
-            return
+        channel_id = str(message.channel.id)
             
         
         if message.content.lower() in game["used_letters"]:
@@ -203,7 +172,7 @@ class Hangman(commands.Cog):
                 victory_embed.set_footer(text=f"Partie terminée par {message.author.name}", icon_url=message.author.display_avatar.url)
                 
                 await message.channel.send(embed=victory_embed)
-                self.add_points(message.guild.id, message.author.id, points)
+                await self.add_points(message.guild.id, message.author.id, points)
                 del self.active_games[channel_id]
                 return
         else:
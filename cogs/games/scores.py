@@ -1,31 +1,18 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
-import os
 from utils.colors import get_embed_color
 
 class Scores(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.scores_file = "data/games/scores.json"
-        self.load_scores()
-        
-    def load_scores(self):
-        
-        try:
-            with open(self.scores_file, "r", encoding="utf-8") as f:
-                self.scores = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.scores = {}
             
     @app_commands.command(name="scores", description="Afficher les scores des jeux")
     async def scores(self, interaction: discord.Interaction):
         
+        scores = await self.bot.storage.get_all_scores()
         
-        self.load_scores()
-        
-        if not self.scores:
+        if not scores:
             await interaction.response.send_message("Aucun score n'a encore été enregistré!", ephemeral=True)
             return
             
@@ -37,7 +24,7 @@ class Scores(commands.Cog):
         )
         
         
-        for guild_id, guild_scores in self.scores.items():
+        for guild_id, guild_scores in scores.items():
             if not guild_scores:
                 continue
                 
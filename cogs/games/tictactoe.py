@@ -1,8 +1,6 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
-import os
 import asyncio
 import random
 from utils.colors import get_embed_color
@@ -10,48 +8,15 @@ from utils.colors import get_embed_color
 class TicTacToe(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.scores_file = "data/games/scores.json"
-        self.load_scores()
         self.active_games = {}
-        
-    def load_scores(self):
-        
-        try:
-            with open(self.scores_file, "r", encoding="utf-8") as f:
-                self.scores = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.scores = {}
-            
-    def save_scores(self):
-        
-        os.makedirs(os.path.dirname(self.scores_file), exist_ok=True)
-        with open(self.scores_file, "w", encoding="utf-8") as f:
-            json.dump(self.scores, f, indent=4)
             
-    def get_player_score(self, guild_id, player_id):
+    async def get_player_score(self, guild_id, player_id):
         
-        guild_id = str(guild_id)
-        player_id = str(player_id)
+        return await self.bot.storage.get_player_score(guild_id, player_id)
         
-        if guild_id not in self.scores:
-            self.scores[guild_id] = {}
-        if player_id not in self.scores[guild_id]:
-            self.scores[guild_id][player_id] = 0
-            
-        return self.scores[guild_id][player_id]
-        
-    def add_points(self, guild_id, player_id, points):
+    async def add_points(self, guild_id, player_id, points):
         
-        guild_id = str(guild_id)
-        player_id = str(player_id)
-        
-        if guild_id not in self.scores:
-            self.scores[guild_id] = {}
-        if player_id not in self.scores[guild_id]:
-            self.scores[guild_id][player_id] = 0
-            
-        self.scores[guild_id][player_id] += points
-        self.save_scores()
+        await self.bot.storage.add_points(guild_id, player_id, points)
         
     def create_board(self):
         
@@ -250,7 +215,7 @@ class TicTacToe(commands.Cog):
             await game["message"].edit(embed=embed, view=None)
             
             
-            self.add_points(game["guild_id"], winner_id, 10)
+            await self.add_points(game["guild_id"], winner_id, 10)
             
             
             del self.active_games[game_id]
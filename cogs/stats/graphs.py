@@ -1,8 +1,6 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
-import os
 import matplotlib.pyplot as plt
 import io
 from datetime import datetime, timedelta
@@ -11,39 +9,16 @@ from utils.colors import get_embed_color
 class StatsGraphs(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.stats_file = "data/stats/server_stats.json"
-        self.load_stats()
         
-    def load_stats(self):
+    async def get_guild_stats(self, guild_id):
         
-        try:
-            with open(self.stats_file, "r", encoding="utf-8") as f:
-                self.stats = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.stats = {}
-        return self.stats
-            
-    def get_guild_stats(self, guild_id):
-        
-        guild_id = str(guild_id)
-        
-        if guild_id not in self.stats:
-            self.stats[guild_id] = {
-                "messages": {},
-                "voice_time": {},
-                "joins": [],
-                "leaves": [],
-                "commands": {},
-                "reactions": {}
-            }
-            
-        return self.stats[guild_id]
+        return await self.bot.storage.get_guild_stats(guild_id)
         
     async def create_messages_graph(self, guild_stats):
         
         
         users = sorted(
-            guild_stats["messages"].items(),
+            guild_stats["messages"]["users"].items(),
             key=lambda x: x[1],
             reverse=True
         )[:10]  
@@ -72,7 +47,7 @@ class StatsGraphs(commands.Cog):
         
         
         users = sorted(
-            guild_stats["voice_time"].items(),
+            guild_stats["voice_time"]["users"].items(),
             key=lambda x: x[1],
             reverse=True
         )[:10]  
@@ -104,7 +79,7 @@ class StatsGraphs(commands.Cog):
         
         
         users = sorted(
-            guild_stats["commands"].items(),
+            guild_stats["commands"]["users"].items(),
             key=lambda x: x[1],
             reverse=True
         )[:10]  
@@ -131,17 +106,17 @@ class StatsGraphs(commands.Cog):
         
     @app_commands.command(name="graphs", description="Afficher les graphiques de statistiques")
     async def graphs(self, interaction: discord.Interaction):
-        guild_id = str(interaction.guild_id)
-        if guild_id not in self.stats:
+        guild_stats = await self.get_guild_stats(interaction.guild_id)
+        if not guild_stats:
             await interaction.response.send_message("Aucune statistique n'est disponible pour ce serveur!", ephemeral=True)
             return
 
         await interaction.response.defer()
 
         
-        messages_graph = await self.create_messages_graph(self.stats[guild_id])
-        voice_time_graph = await self.create_voice_time_graph(self.stats[guild_id])
-        commands_graph = await self.create_commands_graph(self.stats[guild_id])
+        messages_graph = await self.create_messages_graph(guild_stats)
+        voice_time_graph = await self.create_voice_time_graph(guild_stats)
+        commands_graph = await self.create_commands_graph(guild_stats)
 
         
         embed = discord.Embed(
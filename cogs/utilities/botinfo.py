@@ -86,6 +86,92 @@ class BotInfoCommand(commands.Cog):
         )
         
         
+        if hasattr(self.bot, 'anti_spam'):
+            spam_stats = self.bot.anti_spam.get_stats()
+            embed.add_field(
+                name="🛡️ Anti-spam",
+                value=f"👤 Suivis: **{spam_stats['keys']:,}**\n"
+                      f"📨 Horodatages: **{spam_stats['entries']:,}**\n"
+                      f"💾 Mémoire: **{spam_stats['memory'] / 1024:.1f} Ko**\n"
+                      f"🧹 Évincés: **{spam_stats['evicted']:,}**",
+                inline=True
+            )
+        
+        
+        if hasattr(self.bot, 'deletion_queue'):
+            deletion_stats = self.bot.deletion_queue.get_stats()
+            embed.add_field(
+                name="🗑️ Suppressions",
+                value=f"📥 Messages filtrés: **{deletion_stats['queued']:,}**\n"
+                      f"📡 Appels API: **{deletion_stats['rest_calls']:,}**\n"
+                      f"💡 Appels économisés: **{deletion_stats['saved']:,}**",
+                inline=True
+            )
+        
+        
+        if hasattr(self.bot, 'warnings'):
+            warning_stats = self.bot.warnings.get_stats()
+            embed.add_field(
+                name="⚠️ Avertissements",
+                value=f"📤 Envoyés: **{warning_stats['sent']:,}**\n"
+                      f"✏️ Mis à jour: **{warning_stats['edits']:,}**\n"
+                      f"🔕 Regroupés: **{warning_stats['suppressed']:,}**",
+                inline=True
+            )
+        
+        
+        if hasattr(self.bot, 'logs'):
+            dispatch_stats = self.bot.logs.dispatcher.get_stats()
+            archive_stats = self.bot.logs.archive.get_stats()
+            io_stats = self.bot.logs.get_io_stats()
+            embed.add_field(
+                name="📜 Logs",
+                value=f"📥 En attente: **{dispatch_stats['depth']:,}**\n"
+                      f"⏳ Retard: **{dispatch_stats['lag'] * 1000:.0f}ms** (max {dispatch_stats['max_lag'] * 1000:.0f}ms)\n"
+                      f"📨 Embeds: **{dispatch_stats['embeds']:,}** en **{dispatch_stats['messages']:,}** messages\n"
+                      f"🗄️ Archivés: **{archive_stats['appended']:,}** ({archive_stats['segments']:,} segments)\n"
+                      f"💽 Config: **{io_stats['reads']:,}** lecture{'s' if io_stats['reads'] > 1 else ''} / **{io_stats['writes']:,}** écriture{'s' if io_stats['writes'] > 1 else ''}",
+                inline=True
+            )
+        
+        
+        if hasattr(self.bot, 'logs'):
+            cache_stats = self.bot.logs.content_cache.get_stats()
+            embed.add_field(
+                name="🗃️ Cache des messages",
+                value=f"🎯 Taux de succès: **{cache_stats['hit_rate']:.0%}** ({cache_stats['hits']:,}/{cache_stats['hits'] + cache_stats['misses']:,})\n"
+                      f"📦 Messages: **{cache_stats['entries']:,}**\n"
+                      f"💾 Mémoire: **{cache_stats['bytes'] / 1024:.0f} Ko** / {cache_stats['max_bytes'] / 1024:.0f} Ko",
+                inline=True
+            )
+        
+        
+        if hasattr(self.bot, 'audit_cache'):
+            audit_stats = self.bot.audit_cache.get_stats()
+            embed.add_field(
+                name="🔎 Logs d'audit",
+                value=f"⚡ En cache: **{audit_stats['hits'] + audit_stats['waited']:,}**\n"
+                      f"🌐 Appels API: **{audit_stats['fallbacks']:,}**\n"
+                      f"📦 Entrées: **{audit_stats['cached']:,}**",
+                inline=True
+            )
+        
+        
+        if hasattr(self.bot, 'pipeline'):
+            pipeline_stats = self.bot.pipeline.get_stats()
+            latency_lines = [
+                f"`{name}`: **{latency['avg']:.2f}ms** (p95 ≤ {latency['p95']:g}ms)"
+                for name, latency in pipeline_stats["latency"].items()
+                if latency["count"]
+            ]
+            latency_lines.append(f"⏭️ Guildes sans filtre: **{pipeline_stats['skipped']:,}**")
+            embed.add_field(
+                name="⏱️ Pipeline des messages",
+                value="\n".join(latency_lines),
+                inline=True
+            )
+        
+        
         embed.add_field(
             name="💬 Support",
             value="[Discord](https://discord.gg/ug9WcY6fj4)\n"
@@ -37,7 +37,8 @@ class WelcomeEvents(commands.Cog):
             return
 
         
-        if guild_config["channel_id"]:
+        raid = getattr(self.bot, "raid", None)
+        if guild_config["channel_id"] and not (raid and raid.is_raid(member.guild.id)):
             channel = member.guild.get_channel(guild_config["channel_id"])
             if channel:
                 message = guild_config["message"].format(
@@ -48,6 +48,22 @@ from utils.antispam import AntiSpamSystem
 
 from utils.antilinks import AntiLinksSystem
 
+from utils.config_store import GuildConfigStore
+
+from utils.persistence import PersistenceService
+
+from utils.storage import create_storage
+
+from utils.pipeline import MessagePipeline, STAGE_REJECT, STAGE_LINKS, STAGE_SPAM, STAGE_COMMANDS
+
+from utils.deletion_queue import DeletionQueue
+
+from utils.warning_coalescer import WarningCoalescer
+
+from utils.raid import RaidDetector
+
+from utils.audit_cache import AuditLogCache
+
 
 
 
@@ -80,6 +96,60 @@ bot = commands.Bot(command_prefix="!", intents=intents)
 
 bot.start_time = datetime.now()
 
+bot.persistence = PersistenceService()
+
+bot.config_store = GuildConfigStore(bot.persistence)
+
+bot.storage = create_storage(bot, config)
+
+bot.logs = LogsSystem(
+
+    bot,
+
+    cache_bytes=config.get("logs", {}).get("cache_bytes", 4 * 1024 * 1024),
+
+    archive_segment_bytes=config.get("logs", {}).get("archive_segment_bytes", 8 * 1024 * 1024)
+
+)
+
+bot.invites = InvitesSystem(
+
+    bot,
+
+    batch_window=config.get("invites", {}).get("batch_window", 1),
+
+    max_staleness=config.get("invites", {}).get("max_staleness", 5)
+
+)
+
+bot.anti_links = AntiLinksSystem(bot)
+
+bot.anti_spam = AntiSpamSystem(bot)
+
+bot.pipeline = MessagePipeline()
+
+bot.deletion_queue = DeletionQueue(bot)
+
+bot.warnings = WarningCoalescer(bot, window=config.get("moderation", {}).get("warning_window", 5))
+
+raid_config = config.get("raid", {})
+
+bot.raid = RaidDetector(
+
+    bot,
+
+    threshold=raid_config.get("threshold", 10),
+
+    window=raid_config.get("window", 10),
+
+    min_duration=raid_config.get("min_duration", 60),
+
+    summary_interval=raid_config.get("summary_interval", 30)
+
+)
+
+bot.audit_cache = AuditLogCache(bot, ttl=config.get("moderation", {}).get("audit_ttl", 30))
+
 
 
 
@@ -105,43 +175,21 @@ cogs = [
 
 
 
-anti_links = None
-
-anti_spam = None
-
-
-
 @bot.event
 
 async def on_ready():
 
-    global anti_links, anti_spam
+    bot.persistence.start()
 
-    
-
-    
-
-    try:
+    bot.anti_spam.start()
 
-        anti_links = AntiLinksSystem(bot)
+    bot.raid.start()
 
-        logging.info("âœ… Système anti-liens initialisé")
+    bot.invites.start()
 
-    except Exception as e:
-
-        logging.error(f"âŒ Erreur lors de l'initialisation du système anti-liens: {e}")
-
-        
-
-    try:
-
-        anti_spam = AntiSpamSystem(bot)
-
-        logging.info("âœ… Système anti-spam initialisé")
-
-    except Exception as e:
+    bot.logs.start()
 
-        logging.error(f"âŒ Erreur lors de l'initialisation du système anti-spam: {e}")
+    bot.loop.create_task(bot.invites.prime(bot.guilds, concurrency=config.get("invites", {}).get("prime_concurrency", 5)))
 
     
 
@@ -163,22 +211,6 @@ async def on_ready():
 
     
 
-    bot.logs = LogsSystem(bot)
-
-    bot.invites = InvitesSystem(bot)
-
-    
-
-    
-
-    for guild in bot.guilds:
-
-        await bot.invites.cache_invites(guild)
-
-    
-
-    
-
     admin_cogs = [
 
         "cogs.administration.autoclear",
@@ -189,7 +221,9 @@ async def on_ready():
 
         "cogs.administration.antispam_config",
 
-        "cogs.administration.antilinks_config"
+        "cogs.administration.antilinks_config",
+
+        "cogs.administration.theme"
 
     ]
 
@@ -245,13 +279,15 @@ async def on_ready():
 
 async def on_member_join(member):
 
-    
+    if bot.raid.record_join(member):
 
-    inviter = await bot.invites.find_inviter(member)
+        return
+
+    
 
-    await bot.invites.log_member_join(member, inviter)
+    inviter, exact = await bot.invites.find_inviter(member)
 
-    await bot.invites.update_invite_cache(member.guild)
+    await bot.invites.log_member_join(member, inviter, exact)
 
     
 
@@ -263,33 +299,35 @@ async def on_member_join(member):
 
 @bot.event
 
-async def on_member_remove(member):
+async def on_invite_create(invite):
 
-    
+    bot.invites.on_invite_create(invite)
 
-    try:
 
-        async for entry in member.guild.audit_logs(limit=1, action=discord.AuditLogAction.kick):
 
-            moderator = entry.user
+@bot.event
+
+async def on_invite_delete(invite):
+
+    bot.invites.on_invite_delete(invite)
 
-            reason = entry.reason
 
-            if moderator and moderator.id != bot.user.id:
 
-                now = datetime.utcnow()
+@bot.event
 
-                entry_time = entry.created_at.replace(tzinfo=None)
+async def on_member_remove(member):
 
-                time_diff = (now - entry_time).total_seconds()
+    
 
-                if time_diff < 2:
+    compiled = bot.logs.get_filter(member.guild.id)
 
-                    await bot.logs.log_member_kick(member.guild, member, moderator, reason)
+    if compiled.enabled and "moderation" in compiled.destinations:
 
-    except Exception as e:
+        entry = await bot.audit_cache.find(member.guild, discord.AuditLogAction.kick, member.id)
+
+        if entry and entry.user_id != bot.user.id:
 
-        print(f"Erreur lors de la vérification des logs d'audit: {e}")
+            await bot.logs.log_member_kick(member.guild, member, discord.Object(id=entry.user_id), entry.reason)
 
     
 
@@ -299,93 +337,153 @@ async def on_member_remove(member):
 
 
 
-@bot.event
+async def reject_message(message):
 
-async def on_message(message):
+    return message.author.bot or message.guild is None
 
-    if message.author == bot.user:
 
-        return
 
-        
 
-    
 
-    if anti_links and await anti_links.check_links(message):
+def moderation_enabled(guild_id):
 
-        await message.delete()
+    return bot.anti_links.get_filter(guild_id).enabled or bot.anti_spam.get_filter(guild_id).enabled
 
-        await message.channel.send(
 
-            f"âŒ {message.author.mention}, les liens ne sont pas autorisés dans ce salon!",
 
-            delete_after=5
 
-        )
 
-        return
+async def filter_links(message):
 
-        
+    if not await bot.anti_links.check_links(message):
 
-    
+        return False
 
-    if anti_spam and await anti_spam.is_spam(message):
+    bot.deletion_queue.enqueue(message)
 
-        await message.delete()
+    await bot.warnings.warn(
 
-        await message.channel.send(
+        message.channel,
+
+        message.author,
+
+        "links",
+
+        f"âŒ {message.author.mention}, les liens ne sont pas autorisés dans ce salon!"
+
+    )
+
+    return True
+
+
+
+
+
+async def filter_spam(message):
+
+    if not await bot.anti_spam.is_spam(message):
+
+        return False
+
+    bot.deletion_queue.enqueue(message)
+
+    await bot.warnings.warn(
+
+        message.channel,
+
+        message.author,
+
+        "spam",
+
+        f"âŒ {message.author.mention}, vous envoyez trop de messages!"
+
+    )
+
+    return True
 
-            f"âŒ {message.author.mention}, vous envoyez trop de messages!",
 
-            delete_after=5
 
-        )
 
-        return
 
-        
+async def run_commands(message):
 
     await bot.process_commands(message)
 
+    return True
+
+
+
+
+
+bot.pipeline.register("reject", reject_message, STAGE_REJECT)
+
+bot.pipeline.set_gate(moderation_enabled)
+
+bot.pipeline.register("links", filter_links, STAGE_LINKS, moderation=True)
+
+bot.pipeline.register("spam", filter_spam, STAGE_SPAM, moderation=True)
+
+bot.pipeline.register("commands", run_commands, STAGE_COMMANDS)
+
+
+
 
 
 @bot.event
 
-async def on_message_delete(message):
+async def on_message(message):
 
     if message.guild:
 
-        await bot.logs.log_message_delete(message)
+        bot.logs.cache_message(message)
+
+    await bot.pipeline.process(message)
+
+
 
 
 
 @bot.event
 
-async def on_message_edit(before, after):
+async def on_raw_message_delete(payload):
+
+    if payload.guild_id:
 
-    if before.guild and before.content != after.content:
+        await bot.logs.log_message_delete(payload)
 
-        await bot.logs.log_message_edit(before, after)
 
 
+@bot.event
+
+async def on_raw_bulk_message_delete(payload):
+
+    if payload.guild_id:
+
+        await bot.logs.log_bulk_message_delete(payload)
 
 
 
 @bot.event
 
-async def on_member_ban(guild, user):
+async def on_raw_message_edit(payload):
+
+    if payload.guild_id:
+
+        await bot.logs.log_message_edit(payload)
 
-    async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.ban):
 
-        moderator = entry.user
 
-        reason = entry.reason
 
-        if moderator and moderator.id != bot.user.id:
 
-            await bot.logs.log_member_ban(guild, user, moderator, reason)
+@bot.event
+
+async def on_member_ban(guild, user):
+
+    entry = await bot.audit_cache.find(guild, discord.AuditLogAction.ban, user.id, required=True)
+
+    if entry and entry.user_id != bot.user.id:
 
-            break
+        await bot.logs.log_member_ban(guild, user, discord.Object(id=entry.user_id), entry.reason)
 
 
 
@@ -393,15 +491,19 @@ async def on_member_ban(guild, user):
 
 async def on_member_unban(guild, user):
 
-    async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.unban):
+    entry = await bot.audit_cache.find(guild, discord.AuditLogAction.unban, user.id, required=True)
+
+    if entry and entry.user_id != bot.user.id:
+
+        await bot.logs.log_member_unban(guild, user, discord.Object(id=entry.user_id))
 
-        moderator = entry.user
 
-        if moderator and moderator.id != bot.user.id:
 
-            await bot.logs.log_member_unban(guild, user, moderator)
+@bot.event
+
+async def on_audit_log_entry_create(entry):
 
-            break
+    bot.audit_cache.add(entry)
 
 
 
@@ -430,3 +532,11 @@ except Exception as e:
 
 
 bot.run(token)
+
+bot.invites.history.flush_all()
+
+bot.logs.archive.flush_all()
+
+bot.persistence.flush_all()
+
+bot.storage.close()
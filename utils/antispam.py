@@ -1,106 +1,69 @@
 import discord
-import json
-import os
-from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, NamedTuple
+from utils.rate_tracker import SlidingWindowTracker
+
+class SpamFilter(NamedTuple):
+    enabled: bool
+    channels: FrozenSet[int]
+    max_messages: int
+    time_window: float
 
 class AntiSpamSystem:
     def __init__(self, bot):
         self.bot = bot
-        self.config_file = "data/antispam_config.json"
-        self.config = self.load_config()
-        self.message_history = {}  
-
-    def load_config(self) -> Dict:
-        
-        try:
-            
-            if not os.path.exists("data"):
-                os.makedirs("data")
-            
-            
-            if not os.path.exists(self.config_file):
-                default_config = {}
-                with open(self.config_file, "w", encoding="utf-8") as f:
-                    json.dump(default_config, f, indent=4)
-                return default_config
-            
-            
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                if not content:  
-                    default_config = {}
-                    with open(self.config_file, "w", encoding="utf-8") as f:
-                        json.dump(default_config, f, indent=4)
-                    return default_config
-                return json.loads(content)
-                
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            
-            default_config = {}
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(default_config, f, indent=4)
-            return default_config
-
-    def save_config(self):
-        
-        try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=4)
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde de la configuration: {e}")
+        self.store = bot.config_store
+        self.tracker = SlidingWindowTracker()
+        self.filters = {}
+        self.store.subscribe("antispam", self.compile)
+
+    @staticmethod
+    def default_guild_config() -> Dict:
+        return {
+            "enabled": False,
+            "active_channels": [],
+            "max_messages": 5,
+            "time_window": 5
+        }
 
     def get_guild_config(self, guild_id: int) -> Dict:
-        
-        guild_id_str = str(guild_id)
-        if guild_id_str not in self.config:
-            self.config[guild_id_str] = {
-                "enabled": False,
-                "active_channels": [],
-                "max_messages": 5,
-                "time_window": 5  
-            }
-            self.save_config()
-        return self.config[guild_id_str]
+
+        return self.store.get_guild_config("antispam", guild_id, self.default_guild_config)
 
     def update_guild_config(self, guild_id: int, config: Dict):
-        
-        self.config[str(guild_id)] = config
-        self.save_config()
+
+        self.store.update_guild_config("antispam", guild_id, config)
+
+    def start(self):
+        self.tracker.start()
+
+    def get_stats(self) -> Dict:
+        return self.tracker.get_stats()
+
+    def compile(self, guild_id: int) -> SpamFilter:
+        guild_config = self.get_guild_config(guild_id)
+        compiled = SpamFilter(
+            enabled=guild_config["enabled"],
+            channels=frozenset(int(channel_id) for channel_id in guild_config["active_channels"]),
+            max_messages=int(guild_config["max_messages"]),
+            time_window=float(guild_config["time_window"])
+        )
+        self.filters[guild_id] = compiled
+        return compiled
+
+    def get_filter(self, guild_id: int) -> SpamFilter:
+        compiled = self.filters.get(guild_id)
+        if compiled is None:
+            compiled = self.compile(guild_id)
+        return compiled
 
     async def is_spam(self, message: discord.Message) -> bool:
-        
-        
-        self.config = self.load_config()
-        
-        guild_config = self.get_guild_config(message.guild.id)
-        
-        
-        if not guild_config["enabled"]:
-            return False
-            
-        
-        if str(message.channel.id) not in guild_config["active_channels"]:
+
+        compiled = self.get_filter(message.guild.id)
+
+
+        if not compiled.enabled or message.channel.id not in compiled.channels:
             return False
-            
-        
-        if message.guild.id not in self.message_history:
-            self.message_history[message.guild.id] = {}
-        if message.channel.id not in self.message_history[message.guild.id]:
-            self.message_history[message.guild.id][message.channel.id] = {}
-        if message.author.id not in self.message_history[message.guild.id][message.channel.id]:
-            self.message_history[message.guild.id][message.channel.id][message.author.id] = []
-            
-        
-        current_time = datetime.utcnow()
-        self.message_history[message.guild.id][message.channel.id][message.author.id].append(current_time)
-        
-        
-        time_window = timedelta(seconds=guild_config["time_window"])
-        self.message_history[message.guild.id][message.channel.id][message.author.id] = [
-            t for t in self.message_history[message.guild.id][message.channel.id][message.author.id]
-            if current_time - t <= time_window
-        ]
-        
-        
-        return len(self.message_history[message.guild.id][message.channel.id][message.author.id]) > guild_config["max_messages"] 
+
+
+        key = (message.guild.id, message.channel.id, message.author.id)
+        return self.tracker.hit(key, compiled.max_messages, compiled.time_window)
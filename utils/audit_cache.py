@@ -0,0 +1,115 @@
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Optional
+import discord
+
+TRACKED_ACTIONS = frozenset({
+    discord.AuditLogAction.kick,
+    discord.AuditLogAction.ban,
+    discord.AuditLogAction.unban
+})
+
+class AuditLogCache:
+    def __init__(self, bot, ttl: float = 30.0, wait: float = 2.0):
+        self.bot = bot
+        self.ttl = ttl
+        self.wait = wait
+        self.entries: Dict[tuple, deque] = {}
+        self.waiters: Dict[tuple, list] = {}
+        self.added = 0
+        self.hits = 0
+        self.waited = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    @staticmethod
+    def _target_id(entry) -> Optional[int]:
+        return getattr(entry.target, "id", None)
+
+    def add(self, entry: discord.AuditLogEntry):
+        if entry.action not in TRACKED_ACTIONS:
+            return
+        key = (entry.guild.id, entry.action, self._target_id(entry))
+
+        for future in self.waiters.pop(key, []):
+            if not future.done():
+                future.set_result(entry)
+                return
+
+        self.entries.setdefault(key, deque()).append((time.monotonic(), entry))
+        self.added += 1
+        if self.added % 100 == 0:
+            self.prune()
+
+    def prune(self):
+        cutoff = time.monotonic() - self.ttl
+        for key in list(self.entries):
+            queue = self.entries[key]
+            while queue and queue[0][0] < cutoff:
+                queue.popleft()
+            if not queue:
+                del self.entries[key]
+
+    def _pop(self, key) -> Optional[discord.AuditLogEntry]:
+        queue = self.entries.get(key)
+        cutoff = time.monotonic() - self.ttl
+        while queue:
+            added_at, entry = queue.popleft()
+            if added_at >= cutoff:
+                if not queue:
+                    del self.entries[key]
+                return entry
+        self.entries.pop(key, None)
+        return None
+
+    def is_streaming(self, guild: discord.Guild) -> bool:
+        return self.bot.intents.moderation and guild.me is not None and guild.me.guild_permissions.view_audit_log
+
+    async def find(self, guild: discord.Guild, action: discord.AuditLogAction, target_id: int, required: bool = False):
+        key = (guild.id, action, target_id)
+        entry = self._pop(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        if self.is_streaming(guild):
+            future = self.bot.loop.create_future()
+            self.waiters.setdefault(key, []).append(future)
+            try:
+                entry = await asyncio.wait_for(future, timeout=self.wait)
+                self.waited += 1
+                return entry
+            except asyncio.TimeoutError:
+                waiters = self.waiters.get(key)
+                if waiters is not None and future in waiters:
+                    waiters.remove(future)
+                    if not waiters:
+                        del self.waiters[key]
+
+            if not required:
+                self.misses += 1
+                return None
+
+        self.fallbacks += 1
+        return await self._fetch(guild, action, target_id)
+
+    async def _fetch(self, guild: discord.Guild, action: discord.AuditLogAction, target_id: int):
+        try:
+            async for entry in guild.audit_logs(limit=5, action=action):
+                if self._target_id(entry) != target_id:
+                    continue
+                if (discord.utils.utcnow() - entry.created_at).total_seconds() <= self.ttl:
+                    return entry
+        except discord.HTTPException as e:
+            print(f"Erreur lors de la vérification des logs d'audit: {e}")
+        return None
+
+    def get_stats(self) -> Dict:
+        return {
+            "cached": sum(len(queue) for queue in self.entries.values()),
+            "hits": self.hits,
+            "waited": self.waited,
+            "misses": self.misses,
+            "fallbacks": self.fallbacks
+        }
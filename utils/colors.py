@@ -1,12 +1,39 @@
 import json
 
+DEFAULT_COLOR = 0xFFD700
+
+class ThemeRegistry:
+    def __init__(self, config_file="config.json"):
+        self.config_file = config_file
+        self.colors = {}
+        self.default = DEFAULT_COLOR
+        try:
+            self.reload()
+        except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
+            print(f"Erreur lors du chargement des couleurs: {e}")
+
+    @staticmethod
+    def parse_color(color):
+        if isinstance(color, str):
+            return int(color.replace("#", "").replace("0x", ""), 16)
+        return int(color)
+
+    def reload(self):
+        with open(self.config_file, encoding="utf-8") as f:
+            config = json.load(f)
+
+        colors = {
+            color_type: self.parse_color(color)
+            for color_type, color in config.get("embed_colors", {}).items()
+        }
+        self.default = colors.get("default", DEFAULT_COLOR)
+        self.colors = colors
+        return len(colors)
+
+    def get(self, color_type="default"):
+        return self.colors.get(color_type, self.default)
+
+theme = ThemeRegistry()
+
 def get_embed_color(color_type="default"):
-    with open('config.json') as f:
-        config = json.load(f)
-    
-    colors = config["embed_colors"]
-    color = colors.get(color_type, colors["default"])
-    
-    if isinstance(color, str):
-        return int(color.replace("
-    return color
+    return theme.get(color_type)
@@ -0,0 +1,93 @@
+import json
+from typing import Callable, Dict, Optional
+
+
+class GuildConfigStore:
+    FILES = {
+        "antispam": ("data/antispam_config.json", None),
+        "antilinks": ("data/antilinks_config.json", None),
+        "logs": ("data/logs_config.json", "guilds"),
+        "invites": ("data/invites_config.json", "guilds"),
+        "autoclear": ("data/autoclear_config.json", None)
+    }
+
+    def __init__(self, persistence):
+        self.persistence = persistence
+        self.data = {}
+        self.reads = {name: 0 for name in self.FILES}
+        self.listeners = {name: [] for name in self.FILES}
+        for name, (path, root_key) in self.FILES.items():
+            self.data[name] = self._read(name)
+            self.persistence.register(name, path, lambda name=name: self.data[name])
+
+    def _read(self, name: str) -> Dict:
+        path, root_key = self.FILES[name]
+        empty = {root_key: {}} if root_key else {}
+        self.reads[name] += 1
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return empty
+        if not content.strip():
+            return empty
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            print(f"Erreur lors de la lecture de {path}: {e}")
+            return empty
+        if root_key and root_key not in data:
+            data[root_key] = {}
+        return data
+
+    def _guilds(self, name: str) -> Dict:
+        root_key = self.FILES[name][1]
+        return self.data[name][root_key] if root_key else self.data[name]
+
+    def migrate(self, name: str, version: int, migrate_guild: Callable[[Dict], None]):
+        data = self.data[name]
+        if data.get("schema_version", 0) >= version:
+            return
+        for guild_config in self._guilds(name).values():
+            migrate_guild(guild_config)
+        data["schema_version"] = version
+        self.save(name)
+
+    def get_io_stats(self, name: str) -> Dict:
+        writes = self.persistence.stats.get(name, {})
+        return {
+            "reads": self.reads[name],
+            "writes": writes.get("writes", 0),
+            "bytes_written": writes.get("bytes", 0),
+            "pending": name in self.persistence.dirty
+        }
+
+    def save(self, name: str):
+        self.persistence.mark_dirty(name)
+
+    def get_guild_config(self, name: str, guild_id, default: Optional[Callable[[], Dict]] = None) -> Optional[Dict]:
+        guilds = self._guilds(name)
+        guild_id = str(guild_id)
+        if guild_id not in guilds:
+            if default is None:
+                return None
+            guilds[guild_id] = default()
+        return guilds[guild_id]
+
+    def update_guild_config(self, name: str, guild_id, config: Dict):
+        self._guilds(name)[str(guild_id)] = config
+        self.save(name)
+        self.notify(name, guild_id)
+
+    def subscribe(self, name: str, callback: Callable[[int], None]):
+        self.listeners[name].append(callback)
+
+    def notify(self, name: str, guild_id):
+        for callback in self.listeners[name]:
+            try:
+                callback(int(guild_id))
+            except Exception as e:
+                print(f"Erreur lors de la notification de {name}: {e}")
+
+    def all_guild_configs(self, name: str) -> Dict:
+        return self._guilds(name)
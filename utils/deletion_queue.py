@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from typing import Dict, List
+import discord
+
+BULK_DELETE_LIMIT = 100
+
+class DeletionQueue:
+    def __init__(self, bot, window: float = 1.0):
+        self.bot = bot
+        self.window = window
+        self.pending: Dict[int, List[discord.Message]] = {}
+        self.tasks: Dict[int, asyncio.Task] = {}
+        self.queued = 0
+        self.rest_calls = 0
+        self.failed = 0
+
+    def enqueue(self, message: discord.Message):
+        channel_id = message.channel.id
+        self.pending.setdefault(channel_id, []).append(message)
+        self.queued += 1
+        if channel_id not in self.tasks:
+            self.tasks[channel_id] = self.bot.loop.create_task(self._flush_later(message.channel))
+
+    async def _flush_later(self, channel):
+        try:
+            await asyncio.sleep(self.window)
+        finally:
+            self.tasks.pop(channel.id, None)
+        await self.flush(channel)
+
+    async def flush(self, channel):
+        messages = self.pending.pop(channel.id, [])
+        for start in range(0, len(messages), BULK_DELETE_LIMIT):
+            await self._delete_chunk(channel, messages[start:start + BULK_DELETE_LIMIT])
+
+    async def _delete_chunk(self, channel, messages: List[discord.Message]):
+        unique = list({message.id: message for message in messages}.values())
+        try:
+            self.rest_calls += 1
+            if len(unique) == 1:
+                await unique[0].delete()
+            else:
+                await channel.delete_messages(unique)
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as e:
+            if len(unique) == 1:
+                self.failed += 1
+                logging.error(f"❌ Erreur lors de la suppression d'un message dans {channel.id}: {e}")
+                return
+
+            for message in unique:
+                try:
+                    self.rest_calls += 1
+                    await message.delete()
+                except discord.NotFound:
+                    pass
+                except discord.HTTPException as e:
+                    self.failed += 1
+                    logging.error(f"❌ Erreur lors de la suppression d'un message dans {channel.id}: {e}")
+
+    def get_stats(self) -> Dict:
+        return {
+            "queued": self.queued,
+            "pending": sum(len(messages) for messages in self.pending.values()),
+            "rest_calls": self.rest_calls,
+            "saved": max(self.queued - self.rest_calls, 0),
+            "failed": self.failed
+        }
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from discord.ext import tasks
+from utils.persistence import PersistenceService
+
+DAY = 86400
+
+class InviteHistory:
+    def __init__(self, bot, events_file="data/invites_events.jsonl", buckets_file="data/invites_history.json",
+                 event_retention_days=7, bucket_retention_days=90):
+        self.bot = bot
+        self.events_file = events_file
+        self.buckets_file = buckets_file
+        self.event_retention = event_retention_days * DAY
+        self.bucket_retention_days = bucket_retention_days
+        self.pending: List[str] = []
+        self.appended = 0
+        self.compacted = 0
+        self.lock = None
+        try:
+            with open(self.buckets_file, "r", encoding="utf-8") as f:
+                self.history = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.history = {}
+        bot.persistence.register("invite_history", self.buckets_file, lambda: self.history)
+
+    def start(self):
+        if not self.append_loop.is_running():
+            self.append_loop.start()
+        if not self.compact_loop.is_running():
+            self.compact_loop.start()
+
+    @staticmethod
+    def _day(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+    def _guild_history(self, guild_id) -> Dict:
+        return self.history.setdefault(str(guild_id), {"days": {}, "totals": {}})
+
+    def record(self, guild_id, kind: str, member_id, inviter_id=None, code: Optional[str] = None, timestamp: Optional[float] = None):
+        if timestamp is None:
+            timestamp = time.time()
+        self.pending.append(json.dumps({
+            "ts": int(timestamp),
+            "guild_id": int(guild_id),
+            "kind": kind,
+            "member_id": int(member_id),
+            "inviter_id": int(inviter_id) if inviter_id else None,
+            "code": code
+        }))
+
+        day = self._guild_history(guild_id)["days"].setdefault(self._day(timestamp), {"codes": {}, "inviters": {}})
+        if kind == "join" and code:
+            day["codes"][code] = day["codes"].get(code, 0) + 1
+        if inviter_id:
+            counters = day["inviters"].setdefault(str(inviter_id), {"join": 0, "leave": 0})
+            counters[kind] = counters.get(kind, 0) + 1
+        self.bot.persistence.mark_dirty("invite_history")
+
+    def summarize(self, guild_id, days: int = 7) -> Dict:
+        cutoff = self._day(time.time() - (days - 1) * DAY)
+        codes = {}
+        inviters = {}
+        for day, bucket in self._guild_history(guild_id)["days"].items():
+            if day < cutoff:
+                continue
+            for code, joins in bucket["codes"].items():
+                codes[code] = codes.get(code, 0) + joins
+            for inviter_id, counters in bucket["inviters"].items():
+                totals = inviters.setdefault(inviter_id, {"join": 0, "leave": 0})
+                totals["join"] += counters.get("join", 0)
+                totals["leave"] += counters.get("leave", 0)
+        return {"codes": codes, "inviters": inviters}
+
+    def _append(self, lines: List[str]):
+        directory = os.path.dirname(self.events_file) or "."
+        os.makedirs(directory, exist_ok=True)
+        with open(self.events_file, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def _compact_events(self, cutoff: float) -> int:
+        try:
+            with open(self.events_file, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return 0
+
+        kept = []
+        for line in lines:
+            try:
+                if json.loads(line)["ts"] >= cutoff:
+                    kept.append(line)
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+        if len(kept) == len(lines):
+            return 0
+
+        PersistenceService.write_atomic(self.events_file, "".join(kept).encode("utf-8"))
+        return len(lines) - len(kept)
+
+    def compact_buckets(self, now: Optional[float] = None) -> int:
+        if now is None:
+            now = time.time()
+        cutoff = (datetime.fromtimestamp(now, tz=timezone.utc) - timedelta(days=self.bucket_retention_days)).strftime("%Y-%m-%d")
+        folded = 0
+        for guild_history in self.history.values():
+            for day in [day for day in guild_history["days"] if day < cutoff]:
+                for inviter_id, counters in guild_history["days"].pop(day)["inviters"].items():
+                    totals = guild_history["totals"].setdefault(inviter_id, {"join": 0, "leave": 0})
+                    totals["join"] += counters.get("join", 0)
+                    totals["leave"] += counters.get("leave", 0)
+                folded += 1
+        if folded:
+            self.bot.persistence.mark_dirty("invite_history")
+        return folded
+
+    def get_stats(self) -> Dict:
+        return {
+            "appended": self.appended,
+            "pending": len(self.pending),
+            "compacted": self.compacted,
+            "days": sum(len(guild_history["days"]) for guild_history in self.history.values())
+        }
+
+    async def flush(self):
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            if not self.pending:
+                return
+            lines, self.pending = self.pending, []
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._append, lines)
+                self.appended += len(lines)
+            except OSError as e:
+                print(f"Erreur lors de l'écriture de l'historique des invitations: {e}")
+                self.pending = lines + self.pending
+
+    async def compact(self):
+        self.compact_buckets()
+        await self.flush()
+        async with self.lock:
+            try:
+                self.compacted += await asyncio.get_running_loop().run_in_executor(
+                    None, self._compact_events, time.time() - self.event_retention
+                )
+            except OSError as e:
+                print(f"Erreur lors du compactage de l'historique des invitations: {e}")
+
+    @tasks.loop(seconds=5)
+    async def append_loop(self):
+        await self.flush()
+
+    @tasks.loop(hours=1)
+    async def compact_loop(self):
+        await self.compact()
+
+    def flush_all(self):
+        if self.pending:
+            lines, self.pending = self.pending, []
+            self._append(lines)
+            self.appended += len(lines)
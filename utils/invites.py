@@ -1,75 +1,417 @@
-import discord
+import asyncio
 import json
-import os
+import logging
+import time
+import discord
+from collections import deque
 from datetime import datetime
 from utils.colors import get_embed_color
+from discord.ext import tasks
+from utils.leaderboard import Leaderboard
+from utils.invite_history import InviteHistory
+
+VANITY = "vanity"
 
 class InvitesSystem:
-    def __init__(self, bot):
+    def __init__(self, bot, batch_window=1.0, max_staleness=5.0):
         self.bot = bot
-        self.config_file = "data/invites_config.json"
-        self.config = self._load_config()
+        self.store = bot.config_store
         self.invite_cache = {}
-
-    def _load_config(self):
-        os.makedirs("data", exist_ok=True)
-        try:
-            with open(self.config_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {"guilds": {}}
+        self.unclaimed = {}
+        self.locks = {}
+        self.batches = {}
+        self.claim_ttl = 30.0
+        self.batch_window = batch_window
+        self.max_staleness = max_staleness
+        self.batched_joins = 0
+        self.fetches = 0
+        self.vanity_uses = {}
+        self.vanity_joins = 0
+        self.downtime_credits = 0
+        self.reconciled_credits = 0
+        self.leaderboards = {}
+        self.leaderboard_updates = {}
+        self.history = InviteHistory(bot)
+        self.snapshot_file = "data/invites_snapshot.json"
+        self.snapshot_times = {}
+        self.saved_snapshot = self._load_snapshot()
+        bot.persistence.register("invite_snapshot", self.snapshot_file, self._snapshot)
 
     def _save_config(self):
-        try:
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=4)
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde de la configuration: {e}")
+        self.store.save("invites")
+
+    @staticmethod
+    def default_guild_config():
+        return {
+            "enabled": False,
+            "channels": {
+                "joins": None,
+                "leaves": None
+            },
+            "invite_counts": {},
+            "member_inviters": {}
+        }
 
     def get_guild_config(self, guild_id):
-        guild_id = str(guild_id)
-        if guild_id not in self.config["guilds"]:
-            self.config["guilds"][guild_id] = {
-                "enabled": False,
-                "channels": {
-                    "joins": None,
-                    "leaves": None
-                },
-                "invite_counts": {},
-                "member_inviters": {}
-            }
-            self._save_config()
-        return self.config["guilds"][guild_id]
+        return self.store.get_guild_config("invites", guild_id, self.default_guild_config)
 
     def update_guild_config(self, guild_id, new_config):
-        guild_id = str(guild_id)
-        if guild_id not in self.config["guilds"]:
-            self.config["guilds"][guild_id] = {}
-        self.config["guilds"][guild_id].update(new_config)
+        guild_config = self.store.get_guild_config("invites", guild_id, dict)
+        guild_config.update(new_config)
         self._save_config()
-        print(f"Configuration mise à jour pour le serveur {guild_id}: {self.config['guilds'][guild_id]}")
+
+        guild = self.bot.get_guild(int(guild_id))
+        if guild is not None and guild_config.get("enabled") and guild.id not in self.invite_cache:
+            self.bot.loop.create_task(self._prime_guild(guild, asyncio.Semaphore(1)))
+
+    def _lock(self, guild_id):
+        lock = self.locks.get(guild_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.locks[guild_id] = lock
+        return lock
+
+    @staticmethod
+    def _cache_entry(invite):
+        return {
+            "uses": invite.uses or 0,
+            "max_uses": invite.max_uses or 0,
+            "inviter": invite.inviter
+        }
+
+    async def _fetch_vanity_uses(self, guild):
+        if "VANITY_URL" not in guild.features:
+            return None
+        try:
+            vanity = await guild.vanity_invite()
+        except discord.HTTPException:
+            return None
+        return vanity.uses if vanity else None
+
+    def _load_snapshot(self):
+        try:
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _snapshot(self):
+        snapshot = {}
+        for guild_id, cache in self.invite_cache.items():
+            snapshot[str(guild_id)] = {
+                "taken_at": self.snapshot_times.get(guild_id),
+                "vanity_uses": self.vanity_uses.get(guild_id),
+                "invites": {
+                    code: {
+                        "uses": entry["uses"],
+                        "max_uses": entry["max_uses"],
+                        "inviter_id": entry["inviter"].id if entry["inviter"] else None
+                    }
+                    for code, entry in cache.items()
+                }
+            }
+        for guild_id, saved in self.saved_snapshot.items():
+            snapshot.setdefault(guild_id, saved)
+        return snapshot
+
+    def _touch(self, guild_id):
+        self.snapshot_times[guild_id] = int(time.time())
+        self.bot.persistence.mark_dirty("invite_snapshot")
 
     async def cache_invites(self, guild):
-        self.invite_cache[guild.id] = {}
-        for invite in await guild.invites():
-            self.invite_cache[guild.id][invite.code] = invite.uses
+        invites = await guild.invites()
+        self.invite_cache[guild.id] = {invite.code: self._cache_entry(invite) for invite in invites}
+        vanity_uses = await self._fetch_vanity_uses(guild)
+        if vanity_uses is not None:
+            self.vanity_uses[guild.id] = vanity_uses
+        self._touch(guild.id)
+
+        saved = self.saved_snapshot.pop(str(guild.id), None)
+        if saved:
+            await self._credit_downtime(guild, saved, invites)
+
+    async def _credit_downtime(self, guild, saved, invites):
+        saved_invites = saved.get("invites", {})
+        credits = {}
+        fetched = set()
+        for invite in invites:
+            fetched.add(invite.code)
+            delta = (invite.uses or 0) - saved_invites.get(invite.code, {}).get("uses", 0)
+            if delta > 0 and invite.inviter:
+                credits[invite.inviter.id] = credits.get(invite.inviter.id, 0) + delta
+
+        for code, entry in saved_invites.items():
+            if code in fetched or not entry.get("inviter_id") or not entry.get("max_uses"):
+                continue
+            if entry["uses"] + 1 >= entry["max_uses"]:
+                credits[entry["inviter_id"]] = credits.get(entry["inviter_id"], 0) + entry["max_uses"] - entry["uses"]
+
+        vanity_delta = 0
+        if saved.get("vanity_uses") is not None and guild.id in self.vanity_uses:
+            vanity_delta = max(self.vanity_uses[guild.id] - saved["vanity_uses"], 0)
+
+        guild_config = self.get_guild_config(guild.id)
+        if not guild_config["enabled"] or (not credits and not vanity_delta):
+            return
+
+        if credits:
+            await self.bot.storage.credit_invites(guild.id, credits)
+            self.leaderboards.pop(guild.id, None)
+        self.downtime_credits += sum(credits.values()) + vanity_delta
+
+        channel = guild.get_channel(guild_config["channels"]["joins"]) if guild_config["channels"]["joins"] else None
+        if not channel:
+            return
+
+        total = sum(credits.values()) + vanity_delta
+        since = f" depuis <t:{saved['taken_at']}:R>" if saved.get("taken_at") else ""
+        message = f"📥 **{total}** arrivée{'s' if total > 1 else ''} pendant l'absence du bot{since}, créditée{'s' if total > 1 else ''} en bloc :\n"
+        lines = [
+            f"<@{inviter_id}> : +{uses}"
+            for inviter_id, uses in sorted(credits.items(), key=lambda item: item[1], reverse=True)
+        ]
+        if vanity_delta:
+            lines.append(f"Lien personnalisé : +{vanity_delta}")
+        for index, line in enumerate(lines):
+            if len(message) + len(line) + 1 > 1900:
+                message += f"… et {len(lines) - index} autres"
+                break
+            message += line + "\n"
+
+        try:
+            await channel.send(message, allowed_mentions=discord.AllowedMentions.none())
+        except discord.HTTPException as e:
+            print(f"Erreur lors de l'envoi du bilan d'invitations de {guild.id}: {e}")
+
+    async def _prime_guild(self, guild, semaphore):
+        async with semaphore:
+            for attempt in range(3):
+                start = time.perf_counter()
+                try:
+                    async with self._lock(guild.id):
+                        await self.cache_invites(guild)
+                except discord.Forbidden:
+                    logging.warning(f"Invitations de {guild.name} ({guild.id}) inaccessibles : permission manquante")
+                    return
+                except discord.HTTPException as e:
+                    if e.status != 429 or attempt == 2:
+                        logging.error(f"❌ Erreur lors de la mise en cache des invitations de {guild.name} ({guild.id}): {e}")
+                        return
+                    retry_after = float(e.response.headers.get("Retry-After", 1))
+                    logging.warning(f"Limite de requêtes atteinte pour {guild.name}, nouvel essai dans {retry_after:.1f}s")
+                    await asyncio.sleep(retry_after)
+                    continue
+
+                logging.info(f"Invitations de {guild.name} mises en cache en {(time.perf_counter() - start) * 1000:.0f}ms")
+                return
+
+    async def prime(self, guilds, concurrency=5):
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(concurrency)
+        enabled = [guild for guild in guilds if self.get_guild_config(guild.id)["enabled"]]
+        await asyncio.gather(*(self._prime_guild(guild, semaphore) for guild in enabled))
+        if self.saved_snapshot:
+            self.saved_snapshot.clear()
+            self.bot.persistence.mark_dirty("invite_snapshot")
+        logging.info(
+            f"Invitations mises en cache pour {len(enabled)}/{len(guilds)} serveur{'s' if len(guilds) > 1 else ''} "
+            f"en {time.perf_counter() - start:.2f}s"
+        )
+
+    def _credit(self, guild_id, inviter, uses, exact=True, code=None, fetch_id=None):
+        now = time.monotonic()
+        unclaimed = self.unclaimed.setdefault(guild_id, deque())
+        for _ in range(max(uses, 0)):
+            unclaimed.append((now, inviter, exact, code, fetch_id))
+        return max(uses, 0)
+
+    async def _refresh(self, guild):
+        cache = self.invite_cache.get(guild.id)
+        invites = await guild.invites()
+        self.invite_cache[guild.id] = {invite.code: self._cache_entry(invite) for invite in invites}
+        self.fetches += 1
+        self._touch(guild.id)
+        return cache, invites
+
+    @staticmethod
+    def _deltas(cache, invites):
+        fetched = set()
+        for invite in invites:
+            fetched.add(invite.code)
+            previous = cache.get(invite.code)
+            yield invite.inviter, (invite.uses or 0) - (previous["uses"] if previous else 0), True, invite.code
+
+        for code, entry in cache.items():
+            if code not in fetched and entry["max_uses"] and entry["uses"] + 1 >= entry["max_uses"]:
+                yield entry["inviter"], entry["max_uses"] - entry["uses"], False, code
+
+    async def fetch_uses(self, guild, expected=None):
+        cache, invites = await self._refresh(guild)
+        fetch_id = self.fetches
+        if cache is None:
+            return fetch_id
+
+        credited = 0
+        for inviter, uses, exact, code in self._deltas(cache, invites):
+            credited += self._credit(guild.id, inviter, uses, exact=exact, code=code, fetch_id=fetch_id)
+
+        if expected is not None and credited >= expected:
+            return fetch_id
+
+        vanity_uses = await self._fetch_vanity_uses(guild)
+        if vanity_uses is None:
+            return fetch_id
+        previous = self.vanity_uses.get(guild.id, vanity_uses)
+        self.vanity_uses[guild.id] = vanity_uses
+        self.vanity_joins += max(vanity_uses - previous, 0)
+        self._credit(guild.id, VANITY, vanity_uses - previous, code=VANITY, fetch_id=fetch_id)
+        return fetch_id
+
+    def on_invite_create(self, invite):
+        if invite.guild is None or invite.guild.id not in self.invite_cache:
+            return
+        self.invite_cache[invite.guild.id][invite.code] = self._cache_entry(invite)
+        self._touch(invite.guild.id)
+
+    def on_invite_delete(self, invite):
+        if invite.guild is None:
+            return
+        entry = self.invite_cache.get(invite.guild.id, {}).pop(invite.code, None)
+        if entry:
+            self._touch(invite.guild.id)
+        if entry and entry["max_uses"] and entry["uses"] + 1 >= entry["max_uses"]:
+            self._credit(invite.guild.id, entry["inviter"], entry["max_uses"] - entry["uses"], exact=False, code=invite.code)
+
+    def _claim(self, guild_id, fetch_id):
+        unclaimed = self.unclaimed.get(guild_id)
+        cutoff = time.monotonic() - self.claim_ttl
+        while unclaimed and unclaimed[0][0] < cutoff:
+            unclaimed.popleft()
+        if not unclaimed:
+            return None, False, None
+        for index, (_, inviter, exact, code, credit_fetch) in enumerate(unclaimed):
+            if credit_fetch is not None and credit_fetch == fetch_id:
+                del unclaimed[index]
+                return inviter, exact, code
+        _, inviter, _, code, _ = unclaimed.popleft()
+        return inviter, False, code
+
+    async def resolve(self, guild, members):
+        async with self._lock(guild.id):
+            fetch_id = None
+            try:
+                fetch_id = await self.fetch_uses(guild, expected=len(members))
+            except discord.HTTPException as e:
+                print(f"Erreur lors de la récupération des invitations de {guild.id}: {e}")
+
+            produced = [
+                credit[1] for credit in self.unclaimed.get(guild.id, ())
+                if fetch_id is not None and credit[4] == fetch_id
+            ]
+            claims = [self._claim(guild.id, fetch_id) for _ in members]
+
+        if self.get_guild_config(guild.id)["enabled"]:
+            for member, (inviter, _, code) in zip(members, claims):
+                inviter_id = inviter.id if inviter and inviter != VANITY else None
+                self.history.record(guild.id, "join", member.id, inviter_id, code)
+
+        inviters = [inviter for inviter, _, _ in claims]
+        ambiguous = len(produced) > len(members) or len({getattr(inviter, "id", inviter) for inviter in produced}) > 1
+        exact = all(inviters) and not ambiguous and len({getattr(inviter, "id", inviter) for inviter in inviters}) == 1
+        return [(inviter, exact and claim_exact and inviter is not None) for inviter, claim_exact, _ in claims]
+
+    async def reconcile(self, guild):
+        cache, invites = await self._refresh(guild)
+        vanity_uses = await self._fetch_vanity_uses(guild)
+        if vanity_uses is not None:
+            self.vanity_uses[guild.id] = vanity_uses
+        if cache is None:
+            return
+
+        credits = {}
+        for inviter, uses, _, _ in self._deltas(cache, invites):
+            if inviter and uses > 0:
+                credits[inviter.id] = credits.get(inviter.id, 0) + uses
+        if not credits:
+            return
+
+        await self.bot.storage.credit_invites(guild.id, credits)
+        self.leaderboards.pop(guild.id, None)
+        self.reconciled_credits += sum(credits.values())
+        logging.info(f"{sum(credits.values())} utilisation(s) d'invitation non attribuée(s) créditée(s) en bloc sur {guild.name}")
+
+    @tasks.loop(minutes=30)
+    async def reconcile_loop(self):
+        for guild_id in list(self.invite_cache):
+            guild = self.bot.get_guild(guild_id)
+            if guild is None or not self.get_guild_config(guild_id)["enabled"]:
+                self.invite_cache.pop(guild_id, None)
+                self.unclaimed.pop(guild_id, None)
+                continue
+            if guild_id in self.batches or self.bot.raid.is_raid(guild_id):
+                continue
+            async with self._lock(guild_id):
+                try:
+                    await self.reconcile(guild)
+                except discord.HTTPException as e:
+                    print(f"Erreur lors de la réconciliation des invitations de {guild_id}: {e}")
+
+    def start(self):
+        if not self.reconcile_loop.is_running():
+            self.reconcile_loop.start()
+        self.history.start()
 
     async def find_inviter(self, member):
-        if member.guild.id not in self.invite_cache:
-            return None
+        guild = member.guild
+        if guild.id not in self.invite_cache:
+            return None, False
+
+        now = time.monotonic()
+        future = self.bot.loop.create_future()
+        batch = self.batches.get(guild.id)
+        if batch is None:
+            batch = {"first": now, "last": now, "members": [], "futures": []}
+            self.batches[guild.id] = batch
+            self.bot.loop.create_task(self._flush_batch(guild, batch))
+        batch["last"] = now
+        batch["members"].append(member)
+        batch["futures"].append(future)
+        return await future
+
+    async def _flush_batch(self, guild, batch):
+        while True:
+            deadline = min(batch["last"] + self.batch_window, batch["first"] + self.max_staleness)
+            delay = deadline - time.monotonic()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+
+        if self.batches.get(guild.id) is batch:
+            del self.batches[guild.id]
+
+        futures = batch["futures"]
+        self.batched_joins += len(futures)
+        try:
+            results = await self.resolve(guild, batch["members"])
+        except Exception as e:
+            print(f"Erreur lors de l'attribution des invitations de {guild.id}: {e}")
+            results = [(None, False)] * len(futures)
 
-        new_invites = await member.guild.invites()
-        for invite in new_invites:
-            if invite.code in self.invite_cache[member.guild.id]:
-                if invite.uses > self.invite_cache[member.guild.id][invite.code]:
-                    return invite.inviter
-        return None
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
 
-    async def update_invite_cache(self, guild):
-        for invite in await guild.invites():
-            self.invite_cache[guild.id][invite.code] = invite.uses
+    def get_stats(self):
+        return {
+            "joins": self.batched_joins,
+            "fetches": self.fetches,
+            "vanity": self.vanity_joins,
+            "downtime": self.downtime_credits,
+            "reconciled": self.reconciled_credits,
+            "pending": sum(len(batch["futures"]) for batch in self.batches.values())
+        }
 
-    async def log_member_join(self, member, inviter):
+    async def log_member_join(self, member, inviter, exact=True):
         guild_config = self.get_guild_config(member.guild.id)
         
         if not guild_config["enabled"] or not guild_config["channels"]["joins"]:
@@ -79,53 +421,83 @@ class InvitesSystem:
         if not channel:
             return
 
-        if inviter:
-            inviter_id = str(inviter.id)
-            
-            if "invite_counts" not in guild_config:
-                guild_config["invite_counts"] = {}
-            if "member_inviters" not in guild_config:
-                guild_config["member_inviters"] = {}
-            
-            if inviter_id not in guild_config["invite_counts"]:
-                guild_config["invite_counts"][inviter_id] = 0
-            guild_config["invite_counts"][inviter_id] += 1
-            
-            guild_config["member_inviters"][str(member.id)] = inviter_id
-            
-            self._save_config()
-
-            message = f"{member.mention} a rejoint, invité par {inviter.mention} qui a désormais {guild_config['invite_counts'][inviter_id]} invitation{'s' if guild_config['invite_counts'][inviter_id] > 1 else ''}"
+        if inviter == VANITY:
+            message = f"{member.mention} a rejoint via le lien personnalisé du serveur"
+        elif inviter:
+            count = await self.bot.storage.record_join(member.guild.id, member.id, inviter.id)
+            self._update_leaderboard(member.guild.id, inviter.id, count)
+
+            message = f"{member.mention} a rejoint, invité par {inviter.mention} qui a désormais {count} invitation{'s' if count > 1 else ''}"
+            if not exact:
+                message += " (attribution approximative : plusieurs invitations utilisées en même temps)"
         else:
             message = f"{member.mention} a rejoint, mais je ne sais pas qui l'a invité (erreur: code d'invitation non trouvé)"
 
         await channel.send(message)
 
+    async def attribute_batch(self, guild, members):
+        results = await self.resolve(guild, members)
+
+        guild_config = self.get_guild_config(guild.id)
+        record = guild_config["enabled"] and guild_config["channels"]["joins"]
+
+        attributions = []
+        for member, (inviter, exact) in zip(members, results):
+            count = None
+            if inviter and inviter != VANITY and record:
+                count = await self.bot.storage.record_join(guild.id, member.id, inviter.id)
+                self._update_leaderboard(guild.id, inviter.id, count)
+            attributions.append((member, inviter, count, exact))
+        return attributions
+
+    async def log_join_summary(self, guild, attributions):
+        guild_config = self.get_guild_config(guild.id)
+
+        if not guild_config["enabled"] or not guild_config["channels"]["joins"]:
+            return
+
+        channel = guild.get_channel(guild_config["channels"]["joins"])
+        if not channel:
+            return
+
+        lines = []
+        for member, inviter, count, exact in attributions:
+            if inviter == VANITY:
+                lines.append(f"{member.mention}, via le lien personnalisé")
+            elif inviter:
+                lines.append(f"{member.mention}, invité par {inviter.mention} ({count}){'' if exact else ' ~'}")
+            else:
+                lines.append(f"{member.mention}, inviteur inconnu")
+
+        header = f"🚨 {len(attributions)} membre{'s ont' if len(attributions) > 1 else ' a'} rejoint pendant le raid :\n"
+        message = header
+        for index, line in enumerate(lines):
+            if len(message) + len(line) + 1 > 1900:
+                message += f"… et {len(lines) - index} autres"
+                break
+            message += line + "\n"
+
+        await channel.send(message)
+
     async def log_member_leave(self, member):
         guild_config = self.get_guild_config(member.guild.id)
         
-        if not guild_config["enabled"] or not guild_config["channels"]["leaves"]:
+        if not guild_config["enabled"]:
             return
 
-        channel = member.guild.get_channel(guild_config["channels"]["leaves"])
+        inviter_id, count = await self.bot.storage.record_leave(member.guild.id, member.id)
+        self.history.record(member.guild.id, "leave", member.id, inviter_id)
+        if inviter_id:
+            self._update_leaderboard(member.guild.id, inviter_id, count)
+
+        channel = member.guild.get_channel(guild_config["channels"]["leaves"]) if guild_config["channels"]["leaves"] else None
         if not channel:
             return
 
-        member_id = str(member.id)
-        if "member_inviters" in guild_config and member_id in guild_config["member_inviters"]:
-            inviter_id = guild_config["member_inviters"][member_id]
-            if inviter_id in guild_config["invite_counts"]:
-                guild_config["invite_counts"][inviter_id] -= 1
-                if guild_config["invite_counts"][inviter_id] <= 0:
-                    del guild_config["invite_counts"][inviter_id]
-                del guild_config["member_inviters"][member_id]
-                self._save_config()
-
-                inviter = member.guild.get_member(int(inviter_id))
-                if inviter:
-                    message = f"{member.mention} a quitté, il avait été invité par {inviter.mention} qui a désormais {guild_config['invite_counts'].get(inviter_id, 0)} invitation{'s' if guild_config['invite_counts'].get(inviter_id, 0) > 1 else ''}"
-                else:
-                    message = f"{member.mention} a quitté, il avait été invité par un membre qui n'est plus sur le serveur"
+        if inviter_id:
+            inviter = member.guild.get_member(int(inviter_id))
+            if inviter:
+                message = f"{member.mention} a quitté, il avait été invité par {inviter.mention} qui a désormais {count} invitation{'s' if count > 1 else ''}"
             else:
                 message = f"{member.mention} a quitté, il avait été invité par un membre qui n'est plus sur le serveur"
         else:
@@ -133,30 +505,79 @@ class InvitesSystem:
 
         await channel.send(message)
 
-    async def show_leaderboard(self, guild, channel):
-        guild_config = self.get_guild_config(guild.id)
-        print(f"Configuration du serveur: {guild_config}")
-        print(f"Compteurs d'invitations: {guild_config.get('invite_counts', {})}")
+    async def get_leaderboard(self, guild_id):
+        leaderboard = self.leaderboards.get(guild_id)
+        if leaderboard is None:
+            self.leaderboard_updates[guild_id] = {}
+            leaderboard = Leaderboard(await self.bot.storage.get_invite_counts(guild_id))
+            for inviter_id, count in self.leaderboard_updates.pop(guild_id, {}).items():
+                leaderboard.update(inviter_id, count)
+            self.leaderboards[guild_id] = leaderboard
+        return leaderboard
 
-        if not guild_config.get("invite_counts"):
-            return await channel.send("Aucune donnée d'invitation disponible.")
+    def _update_leaderboard(self, guild_id, inviter_id, count):
+        leaderboard = self.leaderboards.get(guild_id)
+        if leaderboard is not None:
+            leaderboard.update(inviter_id, count)
+        elif guild_id in self.leaderboard_updates:
+            self.leaderboard_updates[guild_id][int(inviter_id)] = count
+
+    async def show_leaderboard(self, interaction):
+        leaderboard = await self.get_leaderboard(interaction.guild.id)
+
+        if not len(leaderboard):
+            return await interaction.response.send_message("Aucune donnée d'invitation disponible.")
+
+        view = InviteLeaderboardView(leaderboard, interaction.user)
+        await interaction.response.send_message(embed=view.create_embed(), view=view)
+
+class InviteLeaderboardView(discord.ui.View):
+    PAGE_SIZE = 10
+
+    def __init__(self, leaderboard, user):
+        super().__init__(timeout=180)
+        self.leaderboard = leaderboard
+        self.user = user
+        self.page = 0
+
+        self.previous_button = discord.ui.Button(emoji="◀️", style=discord.ButtonStyle.secondary)
+        self.previous_button.callback = lambda interaction: self.switch_page(interaction, -1)
+        self.next_button = discord.ui.Button(emoji="▶️", style=discord.ButtonStyle.secondary)
+        self.next_button.callback = lambda interaction: self.switch_page(interaction, 1)
+        self.add_item(self.previous_button)
+        self.add_item(self.next_button)
+        self.update_buttons()
+
+    @property
+    def page_count(self):
+        return max((len(self.leaderboard) + self.PAGE_SIZE - 1) // self.PAGE_SIZE, 1)
+
+    def update_buttons(self):
+        self.page = min(self.page, self.page_count - 1)
+        self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= self.page_count - 1
+
+    async def switch_page(self, interaction: discord.Interaction, step: int):
+        self.page += step
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.create_embed(), view=self)
+
+    def create_embed(self) -> discord.Embed:
+        start = self.page * self.PAGE_SIZE
+        lines = [
+            f"**{position}.** <@{inviter_id}> • {count} invitation{'s' if count > 1 else ''}"
+            for position, (inviter_id, count) in enumerate(self.leaderboard.page(start, self.PAGE_SIZE), start + 1)
+        ]
 
-        sorted_inviters = sorted(guild_config["invite_counts"].items(), key=lambda x: x[1], reverse=True)
-        print(f"Classement trié: {sorted_inviters}")
-        
         embed = discord.Embed(
             title="🏆 Classement des invités",
+            description="\n".join(lines),
             color=get_embed_color("info")
         )
 
-        for i, (inviter_id, count) in enumerate(sorted_inviters[:10], 1):
-            member = guild.get_member(int(inviter_id))
-            print(f"Recherche membre {inviter_id}: {member}")
-            if member:
-                embed.add_field(
-                    name=f"{i}. {member.name}",
-                    value=f"{count} invitation{'s' if count > 1 else ''}",
-                    inline=False
-                )
-
-        await channel.send(embed=embed) 
+        rank = self.leaderboard.rank(self.user.id)
+        embed.set_footer(
+            text=f"Page {self.page + 1}/{self.page_count} • "
+                 + (f"Votre rang : {rank}/{len(self.leaderboard)}" if rank else "Vous n'avez invité personne")
+        )
+        return embed
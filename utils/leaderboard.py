@@ -0,0 +1,29 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+class Leaderboard:
+    def __init__(self, counts: Dict[str, int]):
+        self.counts = {int(user_id): count for user_id, count in counts.items() if count > 0}
+        self.ranking = sorted((-count, user_id) for user_id, count in self.counts.items())
+
+    def __len__(self):
+        return len(self.ranking)
+
+    def update(self, user_id, count: int):
+        user_id = int(user_id)
+        previous = self.counts.pop(user_id, None)
+        if previous is not None:
+            del self.ranking[bisect_left(self.ranking, (-previous, user_id))]
+        if count > 0:
+            self.counts[user_id] = count
+            insort(self.ranking, (-count, user_id))
+
+    def page(self, start: int, size: int) -> List[Tuple[int, int]]:
+        return [(user_id, -negative_count) for negative_count, user_id in self.ranking[start:start + size]]
+
+    def rank(self, user_id) -> Optional[int]:
+        user_id = int(user_id)
+        count = self.counts.get(user_id)
+        if count is None:
+            return None
+        return bisect_left(self.ranking, (-count, user_id)) + 1
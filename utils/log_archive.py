@@ -0,0 +1,289 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import math
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+from discord.ext import tasks
+from utils.persistence import PersistenceService
+
+class BloomFilter:
+    def __init__(self, bits: int, hashes: int, value: int = 0):
+        self.bits = bits
+        self.hashes = hashes
+        self.value = value
+
+    @classmethod
+    def for_capacity(cls, items: int, error_rate: float = 0.01) -> "BloomFilter":
+        items = max(items, 1)
+        bits = max(64, math.ceil(-items * math.log(error_rate) / math.log(2) ** 2))
+        hashes = min(16, max(1, round(bits / items * math.log(2))))
+        return cls(bits, hashes)
+
+    def _positions(self, item) -> Iterable[int]:
+        digest = hashlib.blake2b(str(item).encode("utf-8"), digest_size=4 * self.hashes).digest()
+        for i in range(self.hashes):
+            yield int.from_bytes(digest[4 * i:4 * i + 4], "little") % self.bits
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.value |= 1 << position
+
+    def __contains__(self, item) -> bool:
+        return all(self.value >> position & 1 for position in self._positions(item))
+
+    def to_dict(self) -> Dict:
+        return {"bits": self.bits, "hashes": self.hashes, "value": format(self.value, "x")}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BloomFilter":
+        return cls(data["bits"], data["hashes"], int(data["value"] or "0", 16))
+
+class LogArchive:
+    def __init__(self, bot, directory="data/logs", max_segment_bytes=8 * 1024 * 1024):
+        self.bot = bot
+        self.directory = directory
+        self.segments_directory = os.path.join(directory, "segments")
+        self.index_file = os.path.join(directory, "index.json")
+        self.max_segment_bytes = max_segment_bytes
+        self.pending: List[Dict] = []
+        self.blooms: Dict[str, BloomFilter] = {}
+        self.active_users: Optional[set] = None
+        self.appended = 0
+        self.sealed = 0
+        self.scanned = 0
+        self.skipped = 0
+        self.lock = None
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.index = {}
+        bot.persistence.register("log_archive_index", self.index_file, lambda: self.index)
+
+    def start(self):
+        if not self.append_loop.is_running():
+            self.append_loop.start()
+
+    @staticmethod
+    def _day(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+    @staticmethod
+    def user_ids(record: Dict) -> set:
+        payload = record.get("payload") or {}
+        user_ids = {record.get("user_id"), payload.get("moderator_id")}
+        user_ids.update(message[0] for message in (payload.get("messages") or {}).values())
+        user_ids.discard(None)
+        return user_ids
+
+    def _path(self, name: str, suffix: Optional[str] = None) -> str:
+        if suffix is None:
+            suffix = ".jsonl.gz" if self.index[name]["sealed"] else ".jsonl"
+        return os.path.join(self.segments_directory, name + suffix)
+
+    def _load_bloom(self, name: str) -> BloomFilter:
+        with open(self._path(name, ".bloom"), "r", encoding="utf-8") as f:
+            return BloomFilter.from_dict(json.load(f))
+
+    async def _bloom(self, name: str) -> Optional[BloomFilter]:
+        bloom = self.blooms.get(name)
+        if bloom is None:
+            try:
+                bloom = await asyncio.get_running_loop().run_in_executor(None, self._load_bloom, name)
+            except (OSError, json.JSONDecodeError, KeyError):
+                return None
+            self.blooms[name] = bloom
+        return bloom
+
+    def _active(self) -> Optional[str]:
+        return next((name for name, segment in self.index.items() if not segment["sealed"]), None)
+
+    def _open_segment(self, day: str) -> str:
+        number = sum(1 for name in self.index if name.startswith(day))
+        name = f"{day}-{number:03d}"
+        self.index[name] = {"start": None, "end": None, "guilds": [], "count": 0, "size": 0, "sealed": False}
+        self.active_users = set()
+        self.bot.persistence.mark_dirty("log_archive_index")
+        return name
+
+    def record(self, event):
+        self.pending.append({
+            "ts": time.time(),
+            "kind": event.kind,
+            "guild_id": event.guild_id,
+            "channel_id": event.channel_id,
+            "user_id": event.user_id,
+            "payload": event.payload
+        })
+
+    def _append(self, name: str, lines: List[str]):
+        os.makedirs(self.segments_directory, exist_ok=True)
+        with open(os.path.join(self.segments_directory, name + ".jsonl"), "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def _recover(self, name: str) -> Optional[Dict]:
+        path = self._path(name, ".jsonl")
+        state = {"users": set(), "guilds": set(), "start": None, "end": None, "count": 0, "size": 0}
+        if not os.path.exists(path):
+            return None if os.path.exists(path + ".gz") else state
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                state["users"].update(self.user_ids(record))
+                state["guilds"].add(record["guild_id"])
+                state["start"] = state["start"] or record["ts"]
+                state["end"] = record["ts"]
+                state["count"] += 1
+        state["size"] = os.path.getsize(path)
+        return state
+
+    def _seal(self, name: str, users: set) -> BloomFilter:
+        path = self._path(name, ".jsonl")
+        bloom = BloomFilter.for_capacity(len(users))
+        for user_id in users:
+            bloom.add(user_id)
+        if os.path.exists(path):
+            with open(path, "rb") as source, gzip.open(path + ".gz", "wb") as target:
+                shutil.copyfileobj(source, target)
+        PersistenceService.write_atomic(self._path(name, ".bloom"), json.dumps(bloom.to_dict()).encode("utf-8"))
+        if os.path.exists(path):
+            os.remove(path)
+        return bloom
+
+    async def _resume(self, name: str):
+        state = await asyncio.get_running_loop().run_in_executor(None, self._recover, name)
+        segment = self.index[name]
+        if state is None:
+            segment["sealed"] = True
+            self.bot.persistence.mark_dirty("log_archive_index")
+            return
+        self.active_users = state.pop("users")
+        segment.update(state)
+        segment["guilds"] = sorted(state["guilds"])
+
+    async def flush(self):
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            name = self._active()
+            if name is not None and self.active_users is None:
+                await self._resume(name)
+                name = self._active()
+
+            if not self.pending:
+                return
+            records, self.pending = self.pending, []
+            loop = asyncio.get_running_loop()
+
+            day = self._day(records[0]["ts"])
+            if name is not None and (not name.startswith(day) or self.index[name]["size"] >= self.max_segment_bytes):
+                try:
+                    self.blooms[name] = await loop.run_in_executor(None, self._seal, name, self.active_users)
+                    self.index[name]["sealed"] = True
+                    self.bot.persistence.mark_dirty("log_archive_index")
+                    self.sealed += 1
+                except OSError as e:
+                    print(f"Erreur lors de la compression du segment de logs {name}: {e}")
+                    self.pending = records + self.pending
+                    return
+                name = None
+            if name is None:
+                name = self._open_segment(day)
+
+            lines = [json.dumps(record, ensure_ascii=False, default=str) for record in records]
+            try:
+                await loop.run_in_executor(None, self._append, name, lines)
+            except OSError as e:
+                print(f"Erreur lors de l'écriture de l'archive des logs: {e}")
+                self.pending = records + self.pending
+                return
+
+            self._index(name, records, lines)
+
+    def _index(self, name: str, records: List[Dict], lines: List[str]):
+        segment = self.index[name]
+        guilds = set(segment["guilds"])
+        for record in records:
+            guilds.add(record["guild_id"])
+            if self.active_users is not None:
+                self.active_users.update(self.user_ids(record))
+        segment["guilds"] = sorted(guilds)
+        segment["start"] = segment["start"] or records[0]["ts"]
+        segment["end"] = records[-1]["ts"]
+        segment["count"] += len(records)
+        segment["size"] += sum(len(line.encode("utf-8")) + 1 for line in lines)
+        self.appended += len(records)
+
+    async def candidates(self, guild_id: int, user_id: int, since: float) -> List[str]:
+        names = []
+        for name, segment in list(self.index.items()):
+            if segment["end"] is None or segment["end"] < since or guild_id not in segment["guilds"]:
+                continue
+            if segment["sealed"]:
+                bloom = await self._bloom(name)
+                if bloom is not None and user_id not in bloom:
+                    self.skipped += 1
+                    continue
+            elif self.active_users is not None and user_id not in self.active_users:
+                self.skipped += 1
+                continue
+            names.append(name)
+        return sorted(names, reverse=True)
+
+    def _scan(self, path: str, guild_id: int, user_id: int, since: float) -> List[Dict]:
+        opener = gzip.open if path.endswith(".gz") else open
+        matches = []
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record["ts"] >= since and record["guild_id"] == guild_id and user_id in self.user_ids(record):
+                    matches.append(record)
+        return matches
+
+    async def search(self, guild_id: int, user_id: int, since: float):
+        await self.flush()
+        loop = asyncio.get_running_loop()
+        for name in await self.candidates(guild_id, user_id, since):
+            try:
+                matches = await loop.run_in_executor(None, self._scan, self._path(name), guild_id, user_id, since)
+            except OSError as e:
+                print(f"Erreur lors de la lecture du segment de logs {name}: {e}")
+                continue
+            self.scanned += 1
+            for record in reversed(matches):
+                yield record
+
+    def get_stats(self) -> Dict:
+        return {
+            "segments": len(self.index),
+            "appended": self.appended,
+            "pending": len(self.pending),
+            "sealed": self.sealed,
+            "scanned": self.scanned,
+            "skipped": self.skipped
+        }
+
+    @tasks.loop(seconds=5)
+    async def append_loop(self):
+        await self.flush()
+
+    def flush_all(self):
+        if not self.pending:
+            return
+        records, self.pending = self.pending, []
+        name = self._active() or self._open_segment(self._day(records[0]["ts"]))
+        lines = [json.dumps(record, ensure_ascii=False, default=str) for record in records]
+        self._append(name, lines)
+        self._index(name, records, lines)
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Dict, Optional
+import discord
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+MAX_EMBEDS = 10
+MAX_EMBED_CHARS = 6000
+
+class LogDispatcher:
+    def __init__(self, bot, flush_interval: float = 0.5):
+        self.bot = bot
+        self.flush_interval = flush_interval
+        self.destinations: Dict[int, Dict] = {}
+        self.messages = 0
+        self.embeds = 0
+        self.errors = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    @staticmethod
+    def _depth(destination: Dict) -> int:
+        return sum(len(queue) for queue in destination["queues"])
+
+    def enqueue(self, channel, embed: discord.Embed, priority: int = PRIORITY_NORMAL, file: Optional[discord.File] = None):
+        destination = self.destinations.get(channel.id)
+        if destination is None:
+            destination = {"queues": (deque(), deque()), "full": asyncio.Event(), "task": None}
+            self.destinations[channel.id] = destination
+
+        destination["queues"][priority].append((time.monotonic(), embed, file))
+        if self._depth(destination) >= MAX_EMBEDS:
+            destination["full"].set()
+        if destination["task"] is None:
+            destination["task"] = self.bot.loop.create_task(self._worker(channel, destination))
+
+    def _oldest(self, destination: Dict) -> float:
+        return min(queue[0][0] for queue in destination["queues"] if queue)
+
+    def _take(self, destination: Dict):
+        batch = []
+        size = 0
+        for queue in destination["queues"]:
+            while queue and len(batch) < MAX_EMBEDS:
+                embed_size = len(queue[0][1])
+                if batch and (size + embed_size > MAX_EMBED_CHARS or queue[0][2] is not None):
+                    return batch
+                batch.append(queue.popleft())
+                size += embed_size
+                if batch[-1][2] is not None:
+                    return batch
+        return batch
+
+    async def _send(self, channel, batch):
+        await channel.send(
+            embeds=[embed for _, embed, _ in batch],
+            files=[file for _, _, file in batch if file is not None]
+        )
+        self.messages += 1
+        self.embeds += len(batch)
+
+    async def _worker(self, channel, destination: Dict):
+        try:
+            while self._depth(destination):
+                if self._depth(destination) < MAX_EMBEDS:
+                    destination["full"].clear()
+                    delay = self._oldest(destination) + self.flush_interval - time.monotonic()
+                    if delay > 0:
+                        try:
+                            await asyncio.wait_for(destination["full"].wait(), timeout=delay)
+                        except asyncio.TimeoutError:
+                            pass
+
+                batch = self._take(destination)
+                lag = time.monotonic() - batch[0][0]
+                try:
+                    await self._send(channel, batch)
+                except discord.HTTPException as e:
+                    if e.status != 400 or len(batch) == 1:
+                        self.errors += 1
+                        logging.error(f"❌ Erreur lors de l'envoi de {len(batch)} log(s) dans {channel.id}: {e}")
+                        continue
+                    for entry in batch:
+                        try:
+                            await self._send(channel, [entry])
+                        except discord.HTTPException as e:
+                            self.errors += 1
+                            logging.error(f"❌ Erreur lors de l'envoi d'un log dans {channel.id}: {e}")
+
+                self.last_lag = lag
+                self.max_lag = max(self.max_lag, lag)
+        finally:
+            destination["task"] = None
+
+    def get_stats(self) -> Dict:
+        now = time.monotonic()
+        queued = [destination for destination in self.destinations.values() if self._depth(destination)]
+        return {
+            "depth": sum(self._depth(destination) for destination in queued),
+            "lag": max((now - self._oldest(destination) for destination in queued), default=0.0),
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "messages": self.messages,
+            "embeds": self.embeds,
+            "errors": self.errors
+        }
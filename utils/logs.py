@@ -1,252 +1,353 @@
 import discord
-import json
-import os
+import io
+import time
+from collections import Counter, deque
 from datetime import datetime
 from utils.colors import get_embed_color
 from discord.ext import tasks
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+from utils.log_archive import LogArchive
+from utils.log_dispatcher import LogDispatcher, PRIORITY_HIGH, PRIORITY_NORMAL
+from utils.message_cache import CachedMessage, MessageContentCache
+
+EVENT_DESTINATIONS = {
+    "message_delete": "messages",
+    "message_edit": "messages",
+    "message_bulk_delete": "messages",
+    "member_ban": "moderation",
+    "member_unban": "moderation",
+    "member_kick": "moderation"
+}
+
+BULK_SUPPRESS_TTL = 60
+
+@dataclass
+class LogEvent:
+    kind: str
+    guild_id: int
+    channel_id: Optional[int] = None
+    user_id: Optional[int] = None
+    role_ids: Tuple[int, ...] = ()
+    payload: Dict = field(default_factory=dict)
+
+class LogFilter(NamedTuple):
+    enabled: bool
+    destinations: Dict[str, int]
+    ignored_channels: FrozenSet[int]
+    ignored_users: FrozenSet[int]
+    ignored_roles: FrozenSet[int]
 
 class LogsSystem:
-    def __init__(self, bot):
-        self.bot = bot
-        self.config_file = "data/logs_config.json"
-        self._ensure_config_file()
-
-    def _ensure_config_file(self):
-        os.makedirs("data", exist_ok=True)
-        if not os.path.exists(self.config_file):
-            with open(self.config_file, "w") as f:
-                json.dump({"guilds": {}}, f, indent=4)
-
-    def _load_config(self):
-        try:
-            with open(self.config_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {"guilds": {}}
-
-    def _save_config(self, config):
-        with open(self.config_file, "w") as f:
-            json.dump(config, f, indent=4)
+    SCHEMA_VERSION = 1
 
-    def get_guild_config(self, guild_id):
-        guild_id = str(guild_id)
-        config = self._load_config()
-        if guild_id not in config["guilds"]:
-            config["guilds"][guild_id] = {
-                "enabled": False,
-                "channels": {
-                    "messages": None,
-                    "moderation": None,
-                    "administration": None
-                },
-                "filters": {
-                    "ignored_channels": [],
-                    "ignored_users": [],
-                    "ignored_roles": []
-                }
-            }
-            self._save_config(config)
-        else:
-            
-            guild_config = config["guilds"][guild_id]
-            
-            
-            new_channels = {
+    def __init__(self, bot, cache_bytes: int = 4 * 1024 * 1024, archive_segment_bytes: int = 8 * 1024 * 1024):
+        self.bot = bot
+        self.store = bot.config_store
+        self.store.migrate("logs", self.SCHEMA_VERSION, self._migrate_guild_config)
+        self.filters = {}
+        self.ignored = 0
+        self.dispatcher = LogDispatcher(bot)
+        self.content_cache = MessageContentCache(cache_bytes)
+        self.archive = LogArchive(bot, max_segment_bytes=archive_segment_bytes)
+        self.bulk_deleted = set()
+        self.bulk_expiry = deque()
+        self.store.subscribe("logs", self.compile)
+        self.renderers = {
+            "message_delete": self._render_message_delete,
+            "message_edit": self._render_message_edit,
+            "message_bulk_delete": self._render_bulk_delete,
+            "member_ban": self._render_moderation,
+            "member_unban": self._render_moderation,
+            "member_kick": self._render_moderation
+        }
+        self.attachments = {
+            "message_bulk_delete": self._render_transcript
+        }
+
+    def start(self):
+        self.archive.start()
+
+    @staticmethod
+    def default_guild_config():
+        return {
+            "enabled": False,
+            "channels": {
                 "messages": None,
                 "moderation": None,
                 "administration": None
+            },
+            "filters": {
+                "ignored_channels": [],
+                "ignored_users": [],
+                "ignored_roles": []
             }
-            for channel_type, channel_id in new_channels.items():
-                if channel_type not in guild_config["channels"]:
-                    guild_config["channels"][channel_type] = channel_id
-
-            
-            if "filters" not in guild_config:
-                guild_config["filters"] = {
-                    "ignored_channels": [],
-                    "ignored_users": [],
-                    "ignored_roles": []
-                }
-            else:
-                
-                required_filters = ["ignored_channels", "ignored_users", "ignored_roles"]
-                for filter_type in required_filters:
-                    if filter_type not in guild_config["filters"]:
-                        guild_config["filters"][filter_type] = []
-
-            self._save_config(config)
-        return config["guilds"][guild_id]
+        }
+
+    @staticmethod
+    def _migrate_guild_config(guild_config):
+        guild_config.setdefault("enabled", False)
+        channels = guild_config.setdefault("channels", {})
+        for channel_type in ("messages", "moderation", "administration"):
+            channels.setdefault(channel_type, None)
+
+        filters = guild_config.setdefault("filters", {})
+        for filter_type in ("ignored_channels", "ignored_users", "ignored_roles"):
+            filters.setdefault(filter_type, [])
+
+    def get_guild_config(self, guild_id):
+        return self.store.get_guild_config("logs", guild_id, self.default_guild_config)
+
+    def get_io_stats(self):
+        return self.store.get_io_stats("logs")
 
     def update_guild_config(self, guild_id, new_config):
-        guild_id = str(guild_id)
-        config = self._load_config()
-        config["guilds"][guild_id] = new_config
-        self._save_config(config)
+        self.store.update_guild_config("logs", guild_id, new_config)
 
-    async def log_event(self, guild_id: int, event_type: str, embed: discord.Embed):
-        
+    def compile(self, guild_id: int) -> LogFilter:
         guild_config = self.get_guild_config(guild_id)
-        if not guild_config["enabled"]:
+        filters = guild_config["filters"]
+        compiled = LogFilter(
+            enabled=guild_config["enabled"],
+            destinations={
+                destination: int(channel_id)
+                for destination, channel_id in guild_config["channels"].items()
+                if channel_id
+            },
+            ignored_channels=frozenset(int(channel_id) for channel_id in filters["ignored_channels"]),
+            ignored_users=frozenset(int(user_id) for user_id in filters["ignored_users"]),
+            ignored_roles=frozenset(int(role_id) for role_id in filters["ignored_roles"])
+        )
+        self.filters[guild_id] = compiled
+        return compiled
+
+    def get_filter(self, guild_id: int) -> LogFilter:
+        compiled = self.filters.get(guild_id)
+        if compiled is None:
+            compiled = self.compile(guild_id)
+        return compiled
+
+    @staticmethod
+    def _role_ids(member, compiled: LogFilter) -> Tuple[int, ...]:
+        if not compiled.ignored_roles:
+            return ()
+        return tuple(role.id for role in getattr(member, "roles", ()))
+
+    def _member_role_ids(self, guild_id: int, user_id: int) -> Tuple[int, ...]:
+        compiled = self.get_filter(guild_id)
+        if not compiled.ignored_roles:
+            return ()
+        guild = self.bot.get_guild(guild_id)
+        return self._role_ids(guild.get_member(user_id) if guild else None, compiled)
+
+    @staticmethod
+    def is_ignored(event: LogEvent, compiled: LogFilter) -> bool:
+        if event.channel_id is not None and event.channel_id in compiled.ignored_channels:
+            return True
+        if event.user_id is not None and event.user_id in compiled.ignored_users:
+            return True
+        return bool(event.role_ids) and not compiled.ignored_roles.isdisjoint(event.role_ids)
+
+    async def log_event(self, event: LogEvent):
+
+        compiled = self.get_filter(event.guild_id)
+        if not compiled.enabled:
             return
 
-        
-        if "filters" in guild_config:
-            filters = guild_config["filters"]
-            
-            
-            if "ignored_channels" in filters:
-                
-                channel_id = None
-                for field in embed.fields:
-                    if field.name == "Salon":
-                        try:
-                            
-                            channel_id = int(field.value.split("<
-                            break
-                        except:
-                            continue
-                
-                if channel_id and channel_id in filters["ignored_channels"]:
-                    return
-
-            
-            if "ignored_users" in filters:
-                
-                user_id = None
-                for field in embed.fields:
-                    if field.name == "Utilisateur":
-                        try:
-                            
-                            user_id = int(field.value.split("<@")[1].split(">")[0])
-                            break
-                        except:
-                            continue
-                
-                if user_id and user_id in filters["ignored_users"]:
-                    return
-
-            
-            if "ignored_roles" in filters:
-                
-                role_id = None
-                for field in embed.fields:
-                    if field.name == "Rôle":
-                        try:
-                            
-                            role_id = int(field.value.split("<@&")[1].split(">")[0])
-                            break
-                        except:
-                            continue
-                
-                if role_id and role_id in filters["ignored_roles"]:
-                    return
-
-        
-        channel_id = None
-        if event_type.startswith("message"):
-            channel_id = guild_config["channels"]["messages"]
-        elif event_type.startswith("moderation"):
-            channel_id = guild_config["channels"]["moderation"]
-        elif event_type.startswith("administration"):
-            channel_id = guild_config["channels"]["administration"]
-
-        if channel_id:
-            channel = self.bot.get_channel(channel_id)
-            if channel:
-                await channel.send(embed=embed)
+        if self.is_ignored(event, compiled):
+            self.ignored += 1
+            return
 
-    
-    async def log_message_delete(self, message):
-        guild_config = self.get_guild_config(message.guild.id)
-        if not guild_config["enabled"] or not guild_config["channels"]["messages"]:
+        self.archive.record(event)
+
+        channel_id = compiled.destinations.get(EVENT_DESTINATIONS[event.kind])
+        if not channel_id:
             return
 
+        channel = self.bot.get_channel(channel_id)
+        if channel:
+            priority = PRIORITY_HIGH if EVENT_DESTINATIONS[event.kind] == "moderation" else PRIORITY_NORMAL
+            attachment = self.attachments.get(event.kind)
+            self.dispatcher.enqueue(
+                channel,
+                self.renderers[event.kind](event),
+                priority,
+                attachment(event) if attachment else None
+            )
+
+    
+    def _render_message_delete(self, event: LogEvent) -> discord.Embed:
         embed = discord.Embed(
             title="🗑️ Message supprimé",
             color=get_embed_color("logs")
         )
-        embed.add_field(name="Auteur", value=message.author.mention, inline=True)
-        embed.add_field(name="Salon", value=message.channel.mention, inline=True)
-        embed.add_field(name="Contenu", value=message.content or "Aucun contenu", inline=False)
-        embed.set_footer(text=f"ID: {message.id}")
-
-        await self.log_event(message.guild.id, "messages", embed)
-
-    async def log_message_edit(self, before, after):
-        if before.content == after.content:
-            return
-
-        guild_config = self.get_guild_config(before.guild.id)
-        if not guild_config["enabled"] or not guild_config["channels"]["messages"]:
-            return
-
+        embed.add_field(name="Auteur", value=f"<@{event.user_id}>", inline=True)
+        embed.add_field(name="Salon", value=f"<#{event.channel_id}>", inline=True)
+        embed.add_field(name="Contenu", value=(event.payload["content"] or "Aucun contenu")[:1024], inline=False)
+        if event.payload.get("attachments"):
+            embed.add_field(name="Pièces jointes", value="\n".join(event.payload["attachments"])[:1024], inline=False)
+        embed.set_footer(text=f"ID: {event.payload['message_id']}")
+        return embed
+
+    def _render_message_edit(self, event: LogEvent) -> discord.Embed:
         embed = discord.Embed(
             title="✏️ Message modifié",
             color=get_embed_color("logs")
         )
-        embed.add_field(name="Auteur", value=before.author.mention, inline=True)
-        embed.add_field(name="Salon", value=before.channel.mention, inline=True)
-        embed.add_field(name="Avant", value=before.content or "Aucun contenu", inline=False)
-        embed.add_field(name="Après", value=after.content or "Aucun contenu", inline=False)
-        embed.set_footer(text=f"ID: {before.id}")
-
-        await self.log_event(before.guild.id, "messages", embed)
-
-    async def log_member_ban(self, guild, user, moderator, reason):
-        guild_config = self.get_guild_config(guild.id)
-        if not guild_config["enabled"] or not guild_config["channels"]["moderation"]:
-            return
-
-        channel = guild.get_channel(guild_config["channels"]["moderation"])
-        if not channel:
-            return
-
+        embed.add_field(name="Auteur", value=f"<@{event.user_id}>", inline=True)
+        embed.add_field(name="Salon", value=f"<#{event.channel_id}>", inline=True)
+        embed.add_field(name="Avant", value=(event.payload["before"] or "Aucun contenu")[:1024], inline=False)
+        embed.add_field(name="Après", value=(event.payload["after"] or "Aucun contenu")[:1024], inline=False)
+        embed.set_footer(text=f"ID: {event.payload['message_id']}")
+        return embed
+
+    def _render_bulk_delete(self, event: LogEvent) -> discord.Embed:
+        messages = event.payload["messages"]
+        total = len(event.payload["message_ids"])
         embed = discord.Embed(
-            title="🔨 Membre banni",
+            title="🧹 Suppression groupée",
             color=get_embed_color("logs")
         )
-        embed.add_field(name="Utilisateur", value=user.mention, inline=True)
-        embed.add_field(name="Modérateur", value=moderator.mention, inline=True)
-        embed.add_field(name="Raison", value=reason or "Aucune raison", inline=False)
-        embed.set_footer(text=f"ID: {user.id}")
-
-        await channel.send(embed=embed)
-
-    async def log_member_unban(self, guild, user, moderator):
-        guild_config = self.get_guild_config(guild.id)
-        if not guild_config["enabled"] or not guild_config["channels"]["moderation"]:
-            return
-
-        channel = guild.get_channel(guild_config["channels"]["moderation"])
-        if not channel:
-            return
+        embed.add_field(name="Salon", value=f"<#{event.channel_id}>", inline=True)
+        embed.add_field(name="Messages", value=f"{total} ({len(messages)} retrouvé{'s' if len(messages) > 1 else ''})", inline=True)
+        authors = Counter(message.author_id for message in messages.values()).most_common(5)
+        if authors:
+            embed.add_field(
+                name="Auteurs",
+                value="\n".join(f"<@{author_id}> • {count}" for author_id, count in authors),
+                inline=False
+            )
+        embed.set_footer(text="Transcription jointe")
+        return embed
+
+    def _render_transcript(self, event: LogEvent) -> discord.File:
+        guild = self.bot.get_guild(event.guild_id)
+        lines = []
+        for message_id in event.payload["message_ids"]:
+            sent_at = discord.utils.snowflake_time(message_id).strftime("%Y-%m-%d %H:%M:%S")
+            message = event.payload["messages"].get(message_id)
+            if message is None:
+                lines.append(f"[{sent_at}] Contenu inconnu ({message_id})")
+                continue
+            member = guild.get_member(message.author_id) if guild else None
+            author = f"{member} ({message.author_id})" if member else str(message.author_id)
+            lines.append(f"[{sent_at}] {author} : {message.content}")
+            lines.extend(f"    📎 {url}" for url in message.attachments)
+        return discord.File(
+            io.BytesIO("\n".join(lines).encode("utf-8")),
+            filename=f"suppression-{event.channel_id}-{int(time.time())}.txt"
+        )
 
+    def _render_moderation(self, event: LogEvent) -> discord.Embed:
+        title = {
+            "member_ban": "🔨 Membre banni",
+            "member_unban": "🔓 Membre débanni",
+            "member_kick": "👢 Membre expulsé"
+        }[event.kind]
         embed = discord.Embed(
-            title="🔓 Membre débanni",
+            title=title,
             color=get_embed_color("logs")
         )
-        embed.add_field(name="Utilisateur", value=user.mention, inline=True)
-        embed.add_field(name="Modérateur", value=moderator.mention, inline=True)
-        embed.set_footer(text=f"ID: {user.id}")
+        embed.add_field(name="Utilisateur", value=f"<@{event.user_id}>", inline=True)
+        embed.add_field(name="Modérateur", value=f"<@{event.payload['moderator_id']}>", inline=True)
+        if event.kind != "member_unban":
+            embed.add_field(name="Raison", value=event.payload.get("reason") or "Aucune raison", inline=False)
+        embed.set_footer(text=f"ID: {event.user_id}")
+        return embed
+
+    def cache_message(self, message):
+        compiled = self.get_filter(message.guild.id)
+        channel_id = compiled.destinations.get("messages")
+        if not compiled.enabled or not channel_id or message.channel.id == channel_id:
+            return
+        if message.channel.id in compiled.ignored_channels or message.author.id in compiled.ignored_users:
+            return
+        if message.content or message.attachments:
+            self.content_cache.add(message)
 
-        await channel.send(embed=embed)
+    async def log_message_delete(self, payload):
+        if payload.message_id in self.bulk_deleted:
+            return
 
-    async def log_member_kick(self, guild, user, moderator, reason):
-        guild_config = self.get_guild_config(guild.id)
-        if not guild_config["enabled"] or not guild_config["channels"]["moderation"]:
+        cached = self.content_cache.pop(payload.message_id)
+        if cached is None and payload.cached_message is not None:
+            cached = CachedMessage.from_message(payload.cached_message)
+        if cached is None:
             return
 
-        channel = guild.get_channel(guild_config["channels"]["moderation"])
-        if not channel:
+        await self.log_event(LogEvent(
+            kind="message_delete",
+            guild_id=payload.guild_id,
+            channel_id=cached.channel_id,
+            user_id=cached.author_id,
+            role_ids=self._member_role_ids(payload.guild_id, cached.author_id),
+            payload={"content": cached.content, "attachments": cached.attachments, "message_id": payload.message_id}
+        ))
+
+    def _suppress(self, message_ids):
+        now = time.monotonic()
+        while self.bulk_expiry and self.bulk_expiry[0][0] < now:
+            self.bulk_deleted.difference_update(self.bulk_expiry.popleft()[1])
+        self.bulk_deleted.update(message_ids)
+        self.bulk_expiry.append((now + BULK_SUPPRESS_TTL, message_ids))
+
+    async def log_bulk_message_delete(self, payload):
+        message_ids = sorted(payload.message_ids)
+        self._suppress(message_ids)
+
+        discord_cache = {message.id: message for message in payload.cached_messages}
+        compiled = self.get_filter(payload.guild_id)
+        messages = {}
+        for message_id in message_ids:
+            cached = self.content_cache.pop(message_id)
+            if cached is None and message_id in discord_cache:
+                cached = CachedMessage.from_message(discord_cache[message_id])
+            if cached is not None and cached.author_id not in compiled.ignored_users:
+                messages[message_id] = cached
+
+        await self.log_event(LogEvent(
+            kind="message_bulk_delete",
+            guild_id=payload.guild_id,
+            channel_id=payload.channel_id,
+            payload={"message_ids": message_ids, "messages": messages}
+        ))
+
+    async def log_message_edit(self, payload):
+        content = payload.data.get("content")
+        if content is None:
             return
 
-        embed = discord.Embed(
-            title="👢 Membre expulsé",
-            color=get_embed_color("logs")
-        )
-        embed.add_field(name="Utilisateur", value=user.mention, inline=True)
-        embed.add_field(name="Modérateur", value=moderator.mention, inline=True)
-        embed.add_field(name="Raison", value=reason or "Aucune raison", inline=False)
-        embed.set_footer(text=f"ID: {user.id}")
+        cached = self.content_cache.get(payload.message_id)
+        if cached is not None:
+            self.content_cache.put(payload.message_id, cached._replace(content=content))
+        elif payload.cached_message is not None:
+            cached = CachedMessage.from_message(payload.cached_message)
+        if cached is None or cached.content == content:
+            return
 
-        await channel.send(embed=embed)
+        await self.log_event(LogEvent(
+            kind="message_edit",
+            guild_id=payload.guild_id,
+            channel_id=cached.channel_id,
+            user_id=cached.author_id,
+            role_ids=self._member_role_ids(payload.guild_id, cached.author_id),
+            payload={"before": cached.content, "after": content, "message_id": payload.message_id}
+        ))
+
+    async def _log_moderation(self, kind, guild, user, moderator, reason=None):
+        await self.log_event(LogEvent(
+            kind=kind,
+            guild_id=guild.id,
+            user_id=user.id,
+            role_ids=self._role_ids(user, self.get_filter(guild.id)),
+            payload={"moderator_id": moderator.id, "reason": reason}
+        ))
+
+    async def log_member_ban(self, guild, user, moderator, reason):
+        await self._log_moderation("member_ban", guild, user, moderator, reason)
+
+    async def log_member_unban(self, guild, user, moderator):
+        await self._log_moderation("member_unban", guild, user, moderator)
+
+    async def log_member_kick(self, guild, user, moderator, reason):
+        await self._log_moderation("member_kick", guild, user, moderator, reason)
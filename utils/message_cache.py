@@ -0,0 +1,81 @@
+import sys
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+import discord
+
+ENTRY_OVERHEAD = 200
+
+class CachedMessage(NamedTuple):
+    author_id: int
+    channel_id: int
+    content: str
+    attachments: Tuple[str, ...]
+
+    @classmethod
+    def from_message(cls, message: discord.Message) -> "CachedMessage":
+        return cls(
+            author_id=message.author.id,
+            channel_id=message.channel.id,
+            content=message.content,
+            attachments=tuple(attachment.url for attachment in message.attachments)
+        )
+
+class MessageContentCache:
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[int, CachedMessage]" = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _sizeof(entry: CachedMessage) -> int:
+        return ENTRY_OVERHEAD + sys.getsizeof(entry.content) + sum(sys.getsizeof(url) for url in entry.attachments)
+
+    def _evict(self):
+        while self.size > self.max_bytes and self.entries:
+            _, entry = self.entries.popitem(last=False)
+            self.size -= self._sizeof(entry)
+            self.evictions += 1
+
+    def put(self, message_id: int, entry: CachedMessage):
+        previous = self.entries.pop(message_id, None)
+        if previous is not None:
+            self.size -= self._sizeof(previous)
+        self.entries[message_id] = entry
+        self.size += self._sizeof(entry)
+        self._evict()
+
+    def add(self, message: discord.Message):
+        self.put(message.id, CachedMessage.from_message(message))
+
+    def get(self, message_id: int) -> Optional[CachedMessage]:
+        entry = self.entries.get(message_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(message_id)
+        self.hits += 1
+        return entry
+
+    def pop(self, message_id: int) -> Optional[CachedMessage]:
+        entry = self.entries.pop(message_id, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.size -= self._sizeof(entry)
+        self.hits += 1
+        return entry
+
+    def get_stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import os
+import tempfile
+from datetime import datetime
+from typing import Callable, Dict
+from discord.ext import tasks
+
+
+class PersistenceService:
+    def __init__(self, flush_interval: float = 2.0):
+        self.stores = {}
+        self.dirty = set()
+        self.stats = {}
+        self.lock = None
+        self.flush_loop.change_interval(seconds=flush_interval)
+
+    def register(self, name: str, path: str, snapshot: Callable[[], Dict]):
+        self.stores[name] = {"path": path, "snapshot": snapshot}
+        self.stats.setdefault(name, {"writes": 0, "bytes": 0, "errors": 0, "last_write": None})
+
+    def mark_dirty(self, name: str):
+        self.dirty.add(name)
+
+    def start(self):
+        if not self.flush_loop.is_running():
+            self.flush_loop.start()
+
+    def get_stats(self) -> Dict:
+        return {name: dict(stats) for name, stats in self.stats.items()}
+
+    def _serialize(self, name: str) -> bytes:
+        return json.dumps(self.stores[name]["snapshot"](), indent=4).encode("utf-8")
+
+    @staticmethod
+    def write_atomic(path: str, payload: bytes):
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                mode = os.stat(path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _write_batch(self, batch):
+        failed = []
+        for name, path, payload in batch:
+            try:
+                self.write_atomic(path, payload)
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde de {path}: {e}")
+                failed.append(name)
+        return failed
+
+    def _take_batch(self):
+        names = list(self.dirty)
+        self.dirty.clear()
+        batch = []
+        for name in names:
+            try:
+                batch.append((name, self.stores[name]["path"], self._serialize(name)))
+            except Exception as e:
+                print(f"Erreur lors de la sérialisation de {name}: {e}")
+                self.stats[name]["errors"] += 1
+        return batch
+
+    def _record(self, batch, failed):
+        now = datetime.now()
+        for name, path, payload in batch:
+            if name in failed:
+                self.stats[name]["errors"] += 1
+                self.dirty.add(name)
+                continue
+            self.stats[name]["writes"] += 1
+            self.stats[name]["bytes"] += len(payload)
+            self.stats[name]["last_write"] = now
+
+    async def flush(self):
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            if not self.dirty:
+                return
+            batch = self._take_batch()
+            failed = await asyncio.get_running_loop().run_in_executor(None, self._write_batch, batch)
+            self._record(batch, failed)
+
+    def flush_all(self):
+        batch = self._take_batch()
+        failed = self._write_batch(batch)
+        self._record(batch, failed)
+
+    @tasks.loop(seconds=2)
+    async def flush_loop(self):
+        await self.flush()
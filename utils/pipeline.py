@@ -0,0 +1,113 @@
+import bisect
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional
+import discord
+
+STAGE_REJECT = 0
+STAGE_LINKS = 20
+STAGE_SPAM = 30
+STAGE_GAMES = 40
+STAGE_COMMANDS = 50
+
+LATENCY_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0)
+
+StageHandler = Callable[[discord.Message], Awaitable[bool]]
+
+class Stage(NamedTuple):
+    order: int
+    name: str
+    handler: StageHandler
+    moderation: bool
+
+class LatencyHistogram:
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed_ms: float):
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed_ms)] += 1
+        self.count += 1
+        self.total += elapsed_ms
+        if elapsed_ms > self.max:
+            self.max = elapsed_ms
+
+    def percentile(self, fraction: float) -> float:
+        if not self.count:
+            return 0.0
+        target = self.count * fraction
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= target:
+                return min(LATENCY_BUCKETS[index], self.max) if index < len(LATENCY_BUCKETS) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "p95": self.percentile(0.95),
+            "max": self.max,
+            "buckets": dict(zip([f"<={bound}" for bound in LATENCY_BUCKETS] + ["inf"], self.buckets))
+        }
+
+class MessagePipeline:
+    def __init__(self):
+        self.stages: List[Stage] = []
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.gate: Optional[Callable[[int], bool]] = None
+        self.skipped = 0
+
+    def register(self, name: str, handler: StageHandler, order: int, moderation: bool = False):
+        self.unregister(name)
+        self.stages.append(Stage(order, name, handler, moderation))
+        self.stages.sort(key=lambda stage: stage.order)
+        self.histograms.setdefault(name, LatencyHistogram())
+
+    def unregister(self, name: str):
+        self.stages = [stage for stage in self.stages if stage.name != name]
+
+    def set_gate(self, gate: Callable[[int], bool]):
+        self.gate = gate
+        self.histograms.setdefault("guild_gate", LatencyHistogram())
+
+    def _is_moderated(self, message: discord.Message) -> bool:
+        if self.gate is None:
+            return True
+        start = time.perf_counter()
+        moderated = self.gate(message.guild.id)
+        self.histograms["guild_gate"].record((time.perf_counter() - start) * 1000)
+        if not moderated:
+            self.skipped += 1
+        return moderated
+
+    async def process(self, message: discord.Message):
+        moderated = None
+        for stage in self.stages:
+            if stage.moderation:
+                if moderated is None:
+                    moderated = self._is_moderated(message)
+                if not moderated:
+                    continue
+
+            start = time.perf_counter()
+            try:
+                handled = await stage.handler(message)
+            except Exception as e:
+                logging.error(f"❌ Erreur dans l'étape {stage.name} du pipeline: {e}")
+                handled = False
+            self.histograms[stage.name].record((time.perf_counter() - start) * 1000)
+
+            if handled:
+                return stage.name
+        return None
+
+    def get_stats(self) -> Dict:
+        return {
+            "stages": [stage.name for stage in self.stages],
+            "skipped": self.skipped,
+            "latency": {name: histogram.to_dict() for name, histogram in self.histograms.items()}
+        }
@@ -0,0 +1,139 @@
+import logging
+import time
+from collections import deque
+from typing import Dict, Optional
+import discord
+from discord.ext import tasks
+from utils.colors import get_embed_color
+
+class RaidDetector:
+    def __init__(self, bot, threshold: int = 10, window: float = 10.0, half_life: float = 10.0,
+                 min_duration: float = 60.0, summary_interval: float = 30.0):
+        self.bot = bot
+        self.threshold = threshold
+        self.window = window
+        self.half_life = half_life
+        self.min_duration = min_duration
+        self.guilds: Dict[int, Dict] = {}
+        self.raids = 0
+        self.summary_loop.change_interval(seconds=summary_interval)
+
+    def start(self):
+        if not self.summary_loop.is_running():
+            self.summary_loop.start()
+
+    def _decay(self, state: Dict, now: float):
+        if state["updated"]:
+            state["ewma"] *= 0.5 ** ((now - state["updated"]) / self.half_life)
+        state["updated"] = now
+
+    def is_raid(self, guild_id: int) -> bool:
+        state = self.guilds.get(guild_id)
+        return state is not None and state["raid_since"] is not None
+
+    def record_join(self, member: discord.Member, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        state = self.guilds.get(member.guild.id)
+        if state is None:
+            state = {"joins": deque(), "ewma": 0.0, "updated": 0.0, "raid_since": None, "pending": [], "joined": 0}
+            self.guilds[member.guild.id] = state
+
+        joins = state["joins"]
+        joins.append(now)
+        while now - joins[0] > self.window:
+            joins.popleft()
+        self._decay(state, now)
+        state["ewma"] += 1
+
+        if state["raid_since"] is None and len(joins) >= self.threshold:
+            state["raid_since"] = now
+            state["joined"] = 0
+            self.raids += 1
+            self.bot.loop.create_task(self.notify_admins(
+                member.guild,
+                "🚨 Raid détecté",
+                f"**{len(joins)}** arrivées en moins de **{self.window:g}s**.\n"
+                f"Les messages de bienvenue sont suspendus et les arrivées seront résumées toutes les "
+                f"**{self.summary_loop.seconds:g}s**."
+            ))
+
+        if state["raid_since"] is None:
+            return False
+
+        state["pending"].append(member)
+        state["joined"] += 1
+        return True
+
+    async def notify_admins(self, guild: discord.Guild, title: str, description: str):
+        logs_config = self.bot.logs.get_guild_config(guild.id)
+        channel_id = logs_config["channels"]["administration"]
+        if not logs_config["enabled"] or not channel_id:
+            return
+
+        channel = guild.get_channel(int(channel_id))
+        if not channel:
+            return
+
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            color=get_embed_color("logs"),
+            timestamp=discord.utils.utcnow()
+        )
+        try:
+            await channel.send(embed=embed)
+        except discord.HTTPException as e:
+            logging.error(f"❌ Erreur lors de l'envoi de l'alerte de raid pour {guild.id}: {e}")
+
+    async def flush(self, guild: discord.Guild, state: Dict):
+        pending = state["pending"]
+        state["pending"] = []
+        if not pending:
+            return
+
+        attributions = await self.bot.invites.attribute_batch(guild, pending)
+        await self.bot.invites.log_join_summary(guild, attributions)
+        attributed = sum(1 for _, inviter, _, _ in attributions if inviter)
+        await self.notify_admins(
+            guild,
+            "🚨 Raid en cours",
+            f"**{len(pending)}** nouvelle{'s' if len(pending) > 1 else ''} arrivée{'s' if len(pending) > 1 else ''} "
+            f"(**{state['joined']}** depuis le début, {attributed} attribuée{'s' if attributed > 1 else ''})."
+        )
+
+    def get_stats(self) -> Dict:
+        return {
+            "tracked": len(self.guilds),
+            "active": sum(1 for state in self.guilds.values() if state["raid_since"] is not None),
+            "raids": self.raids
+        }
+
+    @tasks.loop(seconds=30)
+    async def summary_loop(self):
+        now = time.monotonic()
+        for guild_id, state in list(self.guilds.items()):
+            self._decay(state, now)
+            if state["raid_since"] is None:
+                if state["ewma"] < 0.5 and now - state["joins"][-1] > self.window:
+                    del self.guilds[guild_id]
+                continue
+
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                del self.guilds[guild_id]
+                continue
+
+            try:
+                await self.flush(guild, state)
+            except Exception as e:
+                logging.error(f"❌ Erreur lors du résumé de raid pour {guild_id}: {e}")
+
+            if state["ewma"] < self.threshold / 2 and now - state["raid_since"] >= self.min_duration:
+                state["raid_since"] = None
+                await self.notify_admins(
+                    guild,
+                    "✅ Fin du raid",
+                    f"Le rythme des arrivées est redevenu normal après **{state['joined']}** arrivées. "
+                    f"Les messages de bienvenue sont réactivés."
+                )
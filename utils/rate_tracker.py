@@ -0,0 +1,57 @@
+import sys
+import time
+from collections import deque
+from typing import Dict, Hashable, Optional
+from discord.ext import tasks
+
+
+class SlidingWindowTracker:
+    def __init__(self, idle_timeout: float = 300.0, sweep_interval: float = 60.0):
+        self.windows = {}
+        self.idle_timeout = idle_timeout
+        self.evicted = 0
+        self.sweep_loop.change_interval(seconds=sweep_interval)
+
+    def start(self):
+        if not self.sweep_loop.is_running():
+            self.sweep_loop.start()
+
+    def hit(self, key: Hashable, max_hits: int, window: float, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        timestamps = self.windows.get(key)
+        if timestamps is None or timestamps.maxlen != max_hits + 1:
+            timestamps = deque(timestamps or (), maxlen=max_hits + 1)
+            self.windows[key] = timestamps
+        timestamps.append(now)
+        return len(timestamps) > max_hits and now - timestamps[0] <= window
+
+    def discard(self, key: Hashable):
+        self.windows.pop(key, None)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        if now is None:
+            now = time.monotonic()
+        cutoff = now - self.idle_timeout
+        idle_keys = [key for key, timestamps in self.windows.items() if not timestamps or timestamps[-1] < cutoff]
+        for key in idle_keys:
+            del self.windows[key]
+        self.evicted += len(idle_keys)
+        return len(idle_keys)
+
+    def get_stats(self) -> Dict:
+        entries = 0
+        memory = sys.getsizeof(self.windows)
+        for key, timestamps in self.windows.items():
+            entries += len(timestamps)
+            memory += sys.getsizeof(key) + sys.getsizeof(timestamps) + len(timestamps) * sys.getsizeof(0.0)
+        return {
+            "keys": len(self.windows),
+            "entries": entries,
+            "memory": memory,
+            "evicted": self.evicted
+        }
+
+    @tasks.loop(seconds=60)
+    async def sweep_loop(self):
+        self.sweep()
@@ -0,0 +1,348 @@
+import asyncio
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from utils.invites import InvitesSystem
+
+
+STAT_METRICS = ("messages", "voice_time", "commands", "reactions")
+
+
+def _read_json(path: str) -> Dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _empty_guild_stats() -> Dict:
+    stats = {metric: {"users": {}, "total": 0} for metric in STAT_METRICS}
+    stats["joins"] = []
+    stats["leaves"] = []
+    return stats
+
+
+class JsonStorage:
+    name = "json"
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.store = bot.config_store
+        self.scores_file = "data/games/scores.json"
+        self.stats_file = "data/stats/server_stats.json"
+        self.scores = _read_json(self.scores_file)
+        self.stats = _read_json(self.stats_file)
+        bot.persistence.register("scores", self.scores_file, lambda: self.scores)
+        bot.persistence.register("stats", self.stats_file, lambda: self.stats)
+
+    def _invites_config(self, guild_id) -> Dict:
+        guild_config = self.store.get_guild_config("invites", guild_id, InvitesSystem.default_guild_config)
+        guild_config.setdefault("invite_counts", {})
+        guild_config.setdefault("member_inviters", {})
+        return guild_config
+
+    async def record_join(self, guild_id, member_id, inviter_id) -> int:
+        guild_config = self._invites_config(guild_id)
+        inviter_id = str(inviter_id)
+        guild_config["invite_counts"][inviter_id] = guild_config["invite_counts"].get(inviter_id, 0) + 1
+        guild_config["member_inviters"][str(member_id)] = inviter_id
+        self.store.save("invites")
+        return guild_config["invite_counts"][inviter_id]
+
+    async def record_leave(self, guild_id, member_id) -> Tuple[Optional[str], int]:
+        guild_config = self._invites_config(guild_id)
+        inviter_id = guild_config["member_inviters"].pop(str(member_id), None)
+        if inviter_id is None:
+            return None, 0
+        count = guild_config["invite_counts"].get(inviter_id, 0) - 1
+        if count <= 0:
+            guild_config["invite_counts"].pop(inviter_id, None)
+            count = 0
+        else:
+            guild_config["invite_counts"][inviter_id] = count
+        self.store.save("invites")
+        return inviter_id, count
+
+    async def credit_invites(self, guild_id, credits: Dict[int, int]):
+        invite_counts = self._invites_config(guild_id)["invite_counts"]
+        for inviter_id, uses in credits.items():
+            inviter_id = str(inviter_id)
+            invite_counts[inviter_id] = invite_counts.get(inviter_id, 0) + uses
+        self.store.save("invites")
+
+    async def get_invite_counts(self, guild_id) -> Dict[str, int]:
+        return dict(self._invites_config(guild_id)["invite_counts"])
+
+    async def add_points(self, guild_id, user_id, points):
+        guild_scores = self.scores.setdefault(str(guild_id), {})
+        guild_scores[str(user_id)] = guild_scores.get(str(user_id), 0) + points
+        self.bot.persistence.mark_dirty("scores")
+
+    async def get_player_score(self, guild_id, user_id) -> int:
+        return self.scores.get(str(guild_id), {}).get(str(user_id), 0)
+
+    async def get_all_scores(self) -> Dict[str, Dict[str, int]]:
+        return {guild_id: dict(guild_scores) for guild_id, guild_scores in self.scores.items()}
+
+    async def increment_stat(self, guild_id, metric, user_id, amount=1):
+        guild_stats = self.stats.setdefault(str(guild_id), _empty_guild_stats())
+        counter = guild_stats.setdefault(metric, {"users": {}, "total": 0})
+        counter["users"][str(user_id)] = counter["users"].get(str(user_id), 0) + amount
+        counter["total"] += amount
+        self.bot.persistence.mark_dirty("stats")
+
+    async def get_guild_stats(self, guild_id) -> Optional[Dict]:
+        return self.stats.get(str(guild_id))
+
+    def close(self):
+        pass
+
+
+class SqliteStorage:
+    name = "sqlite"
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    CREATE TABLE IF NOT EXISTS invite_counts (
+        guild_id INTEGER NOT NULL,
+        inviter_id INTEGER NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (guild_id, inviter_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_invite_counts_rank ON invite_counts (guild_id, count DESC);
+    CREATE TABLE IF NOT EXISTS member_inviters (
+        guild_id INTEGER NOT NULL,
+        member_id INTEGER NOT NULL,
+        inviter_id INTEGER NOT NULL,
+        PRIMARY KEY (guild_id, member_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_member_inviters_inviter ON member_inviters (guild_id, inviter_id);
+    CREATE TABLE IF NOT EXISTS scores (
+        guild_id INTEGER NOT NULL,
+        user_id INTEGER NOT NULL,
+        points INTEGER NOT NULL,
+        PRIMARY KEY (guild_id, user_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_scores_rank ON scores (guild_id, points DESC);
+    CREATE TABLE IF NOT EXISTS stats_counters (
+        guild_id INTEGER NOT NULL,
+        metric TEXT NOT NULL,
+        user_id INTEGER NOT NULL,
+        value REAL NOT NULL,
+        PRIMARY KEY (guild_id, metric, user_id)
+    ) WITHOUT ROWID;
+    """
+
+    def __init__(self, bot, path: str):
+        self.bot = bot
+        self.path = path
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self.conn = None
+        self.executor.submit(self._connect).result()
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self.conn.commit()
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    def import_json(self) -> bool:
+        return self.executor.submit(self._import_json).result()
+
+    def _import_json(self) -> bool:
+        if self.conn.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone():
+            return False
+
+        invites = self.bot.config_store.all_guild_configs("invites")
+        scores = _read_json("data/games/scores.json")
+        stats = _read_json("data/stats/server_stats.json")
+
+        with self.conn:
+            for guild_id, guild_config in invites.items():
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO invite_counts (guild_id, inviter_id, count) VALUES (?, ?, ?)",
+                    [(int(guild_id), int(inviter_id), count) for inviter_id, count in guild_config.get("invite_counts", {}).items()]
+                )
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO member_inviters (guild_id, member_id, inviter_id) VALUES (?, ?, ?)",
+                    [(int(guild_id), int(member_id), int(inviter_id)) for member_id, inviter_id in guild_config.get("member_inviters", {}).items()]
+                )
+            for guild_id, guild_scores in scores.items():
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO scores (guild_id, user_id, points) VALUES (?, ?, ?)",
+                    [(int(guild_id), int(user_id), points) for user_id, points in guild_scores.items()]
+                )
+            for guild_id, guild_stats in stats.items():
+                for metric in STAT_METRICS:
+                    counter = guild_stats.get(metric)
+                    if not isinstance(counter, dict):
+                        continue
+                    users = counter.get("users", counter)
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO stats_counters (guild_id, metric, user_id, value) VALUES (?, ?, ?, ?)",
+                        [(int(guild_id), metric, int(user_id), value) for user_id, value in users.items() if str(user_id).isdigit()]
+                    )
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('json_imported', datetime('now'))")
+        return True
+
+    def _record_join(self, guild_id, member_id, inviter_id):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO invite_counts (guild_id, inviter_id, count) VALUES (?, ?, 1) "
+                "ON CONFLICT (guild_id, inviter_id) DO UPDATE SET count = count + 1",
+                (guild_id, inviter_id)
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO member_inviters (guild_id, member_id, inviter_id) VALUES (?, ?, ?)",
+                (guild_id, member_id, inviter_id)
+            )
+            row = self.conn.execute(
+                "SELECT count FROM invite_counts WHERE guild_id = ? AND inviter_id = ?",
+                (guild_id, inviter_id)
+            ).fetchone()
+        return row[0]
+
+    async def record_join(self, guild_id, member_id, inviter_id) -> int:
+        return await self._run(self._record_join, int(guild_id), int(member_id), int(inviter_id))
+
+    def _record_leave(self, guild_id, member_id):
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT inviter_id FROM member_inviters WHERE guild_id = ? AND member_id = ?",
+                (guild_id, member_id)
+            ).fetchone()
+            if row is None:
+                return None, 0
+            inviter_id = row[0]
+            self.conn.execute(
+                "DELETE FROM member_inviters WHERE guild_id = ? AND member_id = ?",
+                (guild_id, member_id)
+            )
+            self.conn.execute(
+                "UPDATE invite_counts SET count = count - 1 WHERE guild_id = ? AND inviter_id = ?",
+                (guild_id, inviter_id)
+            )
+            self.conn.execute(
+                "DELETE FROM invite_counts WHERE guild_id = ? AND inviter_id = ? AND count <= 0",
+                (guild_id, inviter_id)
+            )
+            row = self.conn.execute(
+                "SELECT count FROM invite_counts WHERE guild_id = ? AND inviter_id = ?",
+                (guild_id, inviter_id)
+            ).fetchone()
+        return str(inviter_id), row[0] if row else 0
+
+    async def record_leave(self, guild_id, member_id) -> Tuple[Optional[str], int]:
+        return await self._run(self._record_leave, int(guild_id), int(member_id))
+
+    def _get_invite_counts(self, guild_id):
+        rows = self.conn.execute(
+            "SELECT inviter_id, count FROM invite_counts WHERE guild_id = ?",
+            (guild_id,)
+        ).fetchall()
+        return {str(inviter_id): count for inviter_id, count in rows}
+
+    def _credit_invites(self, guild_id, credits):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO invite_counts (guild_id, inviter_id, count) VALUES (?, ?, ?) "
+                "ON CONFLICT (guild_id, inviter_id) DO UPDATE SET count = count + excluded.count",
+                [(guild_id, int(inviter_id), uses) for inviter_id, uses in credits.items()]
+            )
+
+    async def credit_invites(self, guild_id, credits: Dict[int, int]):
+        await self._run(self._credit_invites, int(guild_id), credits)
+
+    async def get_invite_counts(self, guild_id) -> Dict[str, int]:
+        return await self._run(self._get_invite_counts, int(guild_id))
+
+    def _add_points(self, guild_id, user_id, points):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO scores (guild_id, user_id, points) VALUES (?, ?, ?) "
+                "ON CONFLICT (guild_id, user_id) DO UPDATE SET points = points + excluded.points",
+                (guild_id, user_id, points)
+            )
+
+    async def add_points(self, guild_id, user_id, points):
+        await self._run(self._add_points, int(guild_id), int(user_id), points)
+
+    def _get_player_score(self, guild_id, user_id):
+        row = self.conn.execute(
+            "SELECT points FROM scores WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id)
+        ).fetchone()
+        return row[0] if row else 0
+
+    async def get_player_score(self, guild_id, user_id) -> int:
+        return await self._run(self._get_player_score, int(guild_id), int(user_id))
+
+    def _get_all_scores(self):
+        scores = {}
+        for guild_id, user_id, points in self.conn.execute("SELECT guild_id, user_id, points FROM scores"):
+            scores.setdefault(str(guild_id), {})[str(user_id)] = points
+        return scores
+
+    async def get_all_scores(self) -> Dict[str, Dict[str, int]]:
+        return await self._run(self._get_all_scores)
+
+    def _increment_stat(self, guild_id, metric, user_id, amount):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO stats_counters (guild_id, metric, user_id, value) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (guild_id, metric, user_id) DO UPDATE SET value = value + excluded.value",
+                (guild_id, metric, user_id, amount)
+            )
+
+    async def increment_stat(self, guild_id, metric, user_id, amount=1):
+        await self._run(self._increment_stat, int(guild_id), metric, int(user_id), amount)
+
+    def _get_guild_stats(self, guild_id):
+        rows = self.conn.execute(
+            "SELECT metric, user_id, value FROM stats_counters WHERE guild_id = ?",
+            (guild_id,)
+        ).fetchall()
+        if not rows:
+            return None
+        stats = _empty_guild_stats()
+        for metric, user_id, value in rows:
+            counter = stats.setdefault(metric, {"users": {}, "total": 0})
+            counter["users"][str(user_id)] = value
+            counter["total"] += value
+        return stats
+
+    async def get_guild_stats(self, guild_id) -> Optional[Dict]:
+        return await self._run(self._get_guild_stats, int(guild_id))
+
+    def _close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def close(self):
+        self.executor.submit(self._close).result()
+        self.executor.shutdown(wait=True)
+
+
+def create_storage(bot, config: Dict):
+    storage_config = config.get("storage", {})
+    backend = storage_config.get("backend", "json")
+    if backend == "sqlite":
+        storage = SqliteStorage(bot, storage_config.get("path", "data/skycy.db"))
+        if storage.import_json():
+            print("Données JSON importées dans la base SQLite")
+        return storage
+    if backend != "json":
+        print(f"Backend de stockage inconnu '{backend}', utilisation de JSON")
+    return JsonStorage(bot)
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import Dict, Hashable, Tuple
+import discord
+
+class WarningCoalescer:
+    def __init__(self, bot, window: float = 5.0, edit_delay: float = 1.0):
+        self.bot = bot
+        self.window = window
+        self.edit_delay = edit_delay
+        self.active: Dict[Tuple[int, int, Hashable], Dict] = {}
+        self.sent = 0
+        self.edits = 0
+        self.suppressed = 0
+
+    async def warn(self, channel, user, reason: Hashable, text: str):
+        key = (channel.id, user.id, reason)
+        entry = self.active.get(key)
+        if entry is not None:
+            entry["count"] += 1
+            self.suppressed += 1
+            self._schedule_edit(key, entry)
+            return
+
+        entry = {"message": None, "text": text, "count": 1, "rendered": 1, "edit_task": None}
+        self.active[key] = entry
+        self.sent += 1
+        try:
+            entry["message"] = await channel.send(text)
+        except discord.HTTPException as e:
+            logging.error(f"❌ Erreur lors de l'envoi d'un avertissement dans {channel.id}: {e}")
+            self.active.pop(key, None)
+            return
+
+        self.bot.loop.create_task(self._expire(key, entry))
+        self._schedule_edit(key, entry)
+
+    def _schedule_edit(self, key, entry: Dict):
+        if entry["message"] is None or entry["edit_task"] is not None or entry["count"] == entry["rendered"]:
+            return
+        entry["edit_task"] = self.bot.loop.create_task(self._edit_later(key, entry))
+
+    async def _edit_later(self, key, entry: Dict):
+        await asyncio.sleep(self.edit_delay)
+        entry["edit_task"] = None
+        if self.active.get(key) is not entry or entry["count"] == entry["rendered"]:
+            return
+
+        entry["rendered"] = entry["count"]
+        self.edits += 1
+        try:
+            await entry["message"].edit(content=f"{entry['text']} (x{entry['count']})")
+        except discord.HTTPException:
+            pass
+
+    async def _expire(self, key, entry: Dict):
+        await asyncio.sleep(self.window)
+        if self.active.get(key) is entry:
+            del self.active[key]
+        if entry["edit_task"] is not None:
+            entry["edit_task"].cancel()
+        try:
+            await entry["message"].delete()
+        except discord.HTTPException:
+            pass
+
+    def get_stats(self) -> Dict:
+        return {
+            "active": len(self.active),
+            "sent": self.sent,
+            "edits": self.edits,
+            "suppressed": self.suppressed
+        }